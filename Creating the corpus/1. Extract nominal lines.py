@@ -1,17 +1,34 @@
+import dictionary
+
 #This is the first script used to create a corpus of nominal stress
 #alternations in Abkhaz. It starts from a plaintext version of
 #Yanagisawa (2010) and extracts all lines containing noun and
 #adjective headwords.
+#It goes through the dictionary once, building an index from every
+#tag in square brackets (e.g. [n.], [adj.], [v.]) to the lines where
+#it appears, and saves it to 1. Tag index.json. The lines for each
+#subcorpus are then read from the index. To extract lines for other
+#parts of speech, add an entry to subcorpora below: this doesn't
+#require another pass through the dictionary.
+
+#Each subcorpus is saved to a file, and consists of the lines with any
+#of its tags, optionally only keeping lines starting with one of a list
+#of prefixes (None keeps every line)
+subcorpora = {}
+
+#Nominal headwords start with the article a-
+subcorpora["1. Nominal lines.txt"] = [["[n.]", "[adj.]"], ["a-", "a¡-"]]
 
-dictionary = []
+tagIndex = dictionary.buildTagIndex("full dictionary.txt")
 
-with open("full dictionary.txt", encoding = "utf-8") as f:
+dictionary.saveTagIndex(tagIndex, "1. Tag index.json")
 
-    dictionary = f.read().split("\n")
+#Save all the lines for each subcorpus (e.g. all the lines containing
+#nominals to 1. Nominal lines.txt)
+for fileName, [tags, prefixes] in subcorpora.items():
 
-dictionary = [line for line in dictionary if (line.startswith("a-") or line.startswith("a¡-")) and ("[n.]" in line or "[adj.]" in line)]
+    lines = dictionary.selectLines("full dictionary.txt", tagIndex, tags, prefixes)
 
-#Save all the lines containing nominals to 1. nominal lines.txt
-with open("1. Nominal lines.txt", mode = "w", encoding = "utf-8") as f:
+    with open(fileName, mode = "w", encoding = "utf-8") as f:
 
-    f.write("\n".join(dictionary))
+        f.write("\n".join(lines))
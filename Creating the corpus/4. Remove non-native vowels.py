@@ -1,3 +1,5 @@
+import nominalPairs
+
 #This script removes all words with non-native graphemes
 #i e o u (и е о у) from 3. Nominal corpus.txt. It outputs
 #4. Nominal corpus (no loans).txt. Note that there are
@@ -11,11 +13,8 @@ with open("3. Nominal corpus.txt", encoding = "utf-8") as f:
 
     nominals = f.read().split("\n")
 
-#Remove any lines containing i e o u
-#It's better to look for the Cyrillic letters, since some
-#of и у are treated as C rather than I U in the phonological
-#transcription.    
-nominals = [nominal for nominal in nominals if not True in [bool(v in nominal.lower()) for v in ["и", "е", "о", "у"]]]
+#Remove any lines containing i e o u (see nominalPairs.isNative)
+nominals = [nominal for nominal in nominals if nominalPairs.isNative(nominal)]
 
 with open("4. Nominal corpus (no loans).txt", encoding = "utf-8", mode = "w") as f:
 
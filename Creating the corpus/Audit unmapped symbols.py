@@ -0,0 +1,26 @@
+import argparse
+
+import encodingAudit
+
+#This script checks a file in the dictionary's mangled encoding (by
+#default 2. Nominal lines cleaned.txt) for symbols which the conversion
+#rules in transcription.py don't cover, and which would therefore be
+#left unchanged in the corpus. It reads the file once (see
+#encodingAudit.py), and prints every such symbol with its frequency and
+#the byte offsets of its first few occurrences, most frequent
+#first.
+
+parser = argparse.ArgumentParser(description = "List symbols not covered by the conversion to orthography and phonology.")
+parser.add_argument("input", nargs = "?", default = "2. Nominal lines cleaned.txt", help = "file to audit")
+parser.add_argument("--ignore", default = "", help = "other characters to accept, e.g. \"!?\"")
+parser.add_argument("--samples", type = int, default = 3, help = "number of offsets to print per symbol")
+args = parser.parse_args()
+
+numBytes, unmapped = encodingAudit.auditFile(args.input, args.ignore, maxSamples = args.samples)
+
+print(f"Bytes read: {numBytes}")
+print(f"Unmapped symbols: {len(unmapped)}")
+
+for c, [count, offsets] in unmapped.items():
+
+    print(f"{c!r} ({encodingAudit.describeCharacter(c)}): {count} times, at " + ", ".join([str(o) for o in offsets]))
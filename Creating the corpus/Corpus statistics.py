@@ -0,0 +1,54 @@
+import argparse
+
+import corpusStats
+
+#This script prints descriptive statistics for the corpus (by default
+#4. Nominal corpus (no loans).txt), computed in one pass through the
+#file (see corpusStats.py): stress position by root length, the rate
+#of stress shifts between the definite and the indefinite, vowel
+#counts, and the most frequent CV templates. Results are cached in
+#the folder Corpus statistics cache, by a hash of the corpus file and
+#of the statistics code, and can also be saved as JSON or CSV.
+
+parser = argparse.ArgumentParser(description = "Compute statistics for a nominal corpus file.")
+parser.add_argument("corpus", nargs = "?", default = "4. Nominal corpus (no loans).txt", help = "corpus file")
+parser.add_argument("--json", help = "save the statistics to this JSON file")
+parser.add_argument("--csv", help = "save the statistics to this CSV file")
+parser.add_argument("--cache", default = "Corpus statistics cache", help = "folder for cached statistics")
+parser.add_argument("--top", type = int, default = 10, help = "number of CV templates to print")
+args = parser.parse_args()
+
+stats = corpusStats.cachedStatistics(args.corpus, args.cache)
+
+if args.json:
+
+    corpusStats.writeJson(stats, args.json)
+
+if args.csv:
+
+    corpusStats.writeCsv(stats, args.csv)
+
+print(f"Nominals: {stats['nominals']}")
+
+for form in corpusStats.forms:
+
+    print(f"Stress position by root length ({form}):")
+
+    for rootLength, row in stats["stressByRootLength"][form].items():
+
+        print(f"  {rootLength}: " + ", ".join([f"{position} {count}" for position, count in row.items()]))
+
+shift = stats["stressShift"]
+print(f"Stress shifts between definite and indefinite: {shift['shifted']} of {shift['same'] + shift['shifted']} ({shift['rate']:.3f})")
+
+for form in corpusStats.forms:
+
+    print(f"Vowels ({form}): " + ", ".join([f"{v} {count}" for v, count in stats["vowels"][form].items()]))
+
+for form in corpusStats.forms:
+
+    print(f"Most frequent CV templates ({form}):")
+
+    for template, count in list(stats["templates"][form].items())[:args.top]:
+
+        print(f"  {template}: {count}")
@@ -0,0 +1,48 @@
+import argparse
+
+import sources
+
+#This script builds a single nominal corpus from several dictionaries
+#in the same plaintext format as full dictionary.txt. Each dictionary
+#goes through the same steps as scripts 1 to 3, in parallel, and the
+#results are joined on the headword (see sources.py). Where the
+#dictionaries disagree, the one listed first is used, and the
+#disagreement is written to a conflict report, marked as "stress" if
+#they only disagree on where the stress is. Records repeated within a
+#dictionary, and headwords with several records in one dictionary, are
+#reported too. The word-specific fixes at the end of script 3 are not
+#applied. The script runs in main(), so that the worker processes, which
+#import this file where processes are spawned rather than forked (e.g.
+#on Windows and macOS), don't run it again.
+
+def main():
+
+    parser = argparse.ArgumentParser(description = "Merge the nominals of several dictionaries into one corpus.")
+    parser.add_argument("dictionaries", nargs = "+", help = "dictionary files, in order of priority")
+    parser.add_argument("--output", default = "3. Merged nominal corpus.txt", help = "file to save the merged corpus to")
+    parser.add_argument("--conflicts", default = "3. Merge conflicts.txt", help = "file to save the conflict report to")
+    parser.add_argument("--workers", type = int, help = "number of dictionaries to read at once (default: all of them)")
+    args = parser.parse_args()
+
+    if len(set(args.dictionaries)) < len(args.dictionaries):
+
+        parser.error("each dictionary can only be listed once")
+
+    sourceRecords = sources.readSources(args.dictionaries, args.workers or len(args.dictionaries))
+
+    for fileName, records in zip(args.dictionaries, sourceRecords):
+
+        print(f"{fileName}: {len(records)} nominals")
+
+    merged, conflicts = sources.mergeSources(args.dictionaries, sourceRecords)
+
+    sources.writeCorpus(merged, args.output)
+    sources.writeConflicts(conflicts, args.conflicts)
+
+    print(f"Merged corpus: {len(merged)} nominals")
+    print(f"Conflicts: {len([c for c in conflicts if c[1] == 'stress'])} on stress, {len([c for c in conflicts if c[1] == 'form'])} on other forms")
+    print(f"Within dictionaries: {len([c for c in conflicts if c[1] == 'duplicate'])} repeated records, {len([c for c in conflicts if c[1] == 'variants'])} headwords with several records")
+
+if __name__ == "__main__":
+
+    main()
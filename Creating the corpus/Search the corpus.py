@@ -0,0 +1,30 @@
+import argparse
+
+import orthographicIndex
+
+#This script finds the nominals in the corpus (by default 4. Nominal
+#corpus (no loans).txt) whose definite or indefinite contains some
+#letters, e.g. ӡ, or starts or ends with them, e.g. --suffix ҩЫ. It
+#uses a suffix array saved beside the corpus (see orthographicIndex.py),
+#which is built the first time, and again whenever the corpus changes.
+#The matching lines are printed as they are in the corpus.
+
+parser = argparse.ArgumentParser(description = "Search the orthography of the corpus.")
+parser.add_argument("pattern", help = "letters to search for, in the orthography")
+parser.add_argument("corpus", nargs = "?", default = "4. Nominal corpus (no loans).txt", help = "corpus file")
+kinds = parser.add_mutually_exclusive_group()
+kinds.add_argument("--prefix", action = "store_const", dest = "kind", const = "prefix", default = "substring", help = "find forms starting with the pattern")
+kinds.add_argument("--suffix", action = "store_const", dest = "kind", const = "suffix", help = "find forms ending in the pattern")
+parser.add_argument("--ignore-stress", action = "store_true", help = "don't tell stressed and unstressed vowels apart")
+args = parser.parse_args()
+
+index = orthographicIndex.loadIndex(args.corpus)
+matches = index.search(args.pattern, args.kind, args.ignore_stress)
+
+index.close()
+
+for record in matches:
+
+    print(" ".join(record))
+
+print(f"Nominals found: {len(matches)}")
@@ -0,0 +1,161 @@
+import fnmatch
+import re
+
+import nominalPairs
+import sources
+
+#This module runs scripts 1 to 4 in memory, from the dictionary to the
+#final corpus records, without writing any of the intermediate files,
+#and lets us pick out part of the corpus with a filter expression. The
+#evaluators can take the records straight from a Corpus (see
+#dybo.nominalsFromRecords), so a single process can go from the raw
+#dictionary to the evaluation of a theory.
+#
+#A filter expression is a list of conditions separated by spaces,
+#all of which have to hold, e.g. "template=C(V)C(V)C(V) vowels=*A*".
+#The conditions are:
+#template=T: the CV template of the root (in the definite) matches T,
+#where C is a consonant, V is a vowel, (...) is optional and * is any
+#sequence, e.g. C(V)C(V)C(V) matches CCC, CVCC, CCCV, CVCVCV, ... (but
+#not CC or CVC, since every C has to be there)
+#vowels=P: the vowels of the root (in the definite, e.g. aY) match the
+#pattern P, where * is any sequence and ? is any single vowel
+#definite=P, indefinite=P: the phonology of the definite or the
+#indefinite matches P, in the same way
+
+class Corpus:
+
+    #records are (defOrth, defPhon, indfOrth, indfPhon) tuples
+    def __init__(self, records):
+
+        self.records = list(records)
+
+    def __len__(self):
+
+        return len(self.records)
+
+    def __iter__(self):
+
+        return iter(self.records)
+
+    #The corpus lines, in the format of 4. Nominal corpus (no loans).txt
+    def lines(self):
+
+        return [" ".join(record) for record in self.records]
+
+    #A new Corpus with the records matching a filter expression
+    def filter(self, expression):
+
+        matches = compileFilter(expression)
+
+        return Corpus([record for record in self.records if matches(record)])
+
+    #This function saves the corpus in the same format as the scripts
+    def save(self, fileName):
+
+        with open(fileName, mode = "w", encoding = "utf-8") as f:
+
+            f.write("\n".join(self.lines()))
+
+#This function builds the corpus from the dictionary in memory, going
+#through the same steps as scripts 1 to 4. With native = False, likely
+#loans aren't removed (as in 3. Nominal corpus.txt).
+def buildCorpus(fileName, native = True):
+
+    records = nominalPairs.fixRecords(sources.readSource(fileName))
+
+    if native:
+
+        records = filter(nominalPairs.isNative, records)
+
+    return Corpus(records)
+
+#This function loads a corpus saved by the scripts (or Corpus.save)
+def loadCorpus(fileName):
+
+    with open(fileName, encoding = "utf-8") as f:
+
+        return Corpus([tuple(line.split(" ")) for line in f.read().split("\n") if line])
+
+#The root of a record in the definite (without the prefix)
+def definiteRoot(record):
+
+    return record[1][1:]
+
+#The CV template of a record's root, e.g. CVCV for aCaCA
+def rootTemplate(record):
+
+    return "".join(["C" if s == "C" else "V" for s in definiteRoot(record)])
+
+#The vowels of a record's root, e.g. aA for aCaCA
+def rootVowels(record):
+
+    return "".join([s for s in definiteRoot(record) if s != "C"])
+
+#This function compiles a regular expression made from a filter
+#pattern, raising ValueError (with the pattern) if it isn't valid
+def compilePattern(regex, pattern):
+
+    try:
+
+        return re.compile(regex)
+
+    except re.error as e:
+
+        raise ValueError(f"{pattern} is not a valid pattern ({e})")
+
+#This function turns a template pattern into a regular expression
+def templateRegex(pattern):
+
+    regex = ""
+
+    for c in pattern:
+
+        if c == "(":
+
+            regex += "(?:"
+
+        elif c == ")":
+
+            regex += ")?"
+
+        elif c == "*":
+
+            regex += ".*"
+
+        else:
+
+            regex += re.escape(c)
+
+    return compilePattern(regex, pattern)
+
+#This function turns a pattern with * and ? into a regular expression
+def globRegex(pattern):
+
+    return compilePattern(fnmatch.translate(pattern), pattern)
+
+#What each condition looks at, and how its pattern is compiled
+conditions = {}
+conditions["template"] = [rootTemplate, templateRegex]
+conditions["vowels"] = [rootVowels, globRegex]
+conditions["definite"] = [lambda record: record[1], globRegex]
+conditions["indefinite"] = [lambda record: record[3], globRegex]
+
+#This function compiles a filter expression (see above) into a function
+#which takes a record and returns True if it matches. An empty
+#expression matches every record.
+def compileFilter(expression):
+
+    tests = []
+
+    for condition in (expression or "").split():
+
+        name, _, pattern = condition.partition("=")
+
+        if name not in conditions or not pattern:
+
+            raise ValueError(f"{condition} is not a filter condition (use " + ", ".join([f"{c}=..." for c in conditions]) + ")")
+
+        tests.append([conditions[name][0], conditions[name][1](pattern)])
+
+    return lambda record: all([regex.fullmatch(get(record)) for get, regex in tests])
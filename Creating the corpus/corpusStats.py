@@ -0,0 +1,297 @@
+import csv
+import hashlib
+import json
+import os
+from array import array
+from collections import Counter
+
+#This module computes descriptive statistics for a corpus file in the
+#format of 4. Nominal corpus (no loans).txt, in a single pass through
+#the file: where stress falls for roots of each length, how often
+#stress shifts between the definite and the indefinite, how many of
+#each vowel there are, and how frequent each CV template (e.g. VCCVC
+#for aCCYC) is. Lines are read one at a time, and the stress positions
+#are counted in fixed-size arrays, so memory use doesn't grow with the
+#size of the corpus. The file is hashed in the same pass, and results
+#are cached by that hash together with a hash of this module, so
+#changing the statistics (or maxLength) doesn't give stale results.
+
+#Roots longer than this (in segments) are counted together with roots
+#of this length, and templates of forms longer than this are cut off
+#after it (e.g. VCCV...+)
+maxLength = 16
+
+#Stress positions: 0 is the definite prefix, 1 to maxLength are the
+#root segments, and maxLength + 1 is the indefinite suffix
+numPositions = maxLength + 2
+
+forms = ["definite", "indefinite"]
+vowels = ["a", "A", "y", "Y"]
+
+#This function returns empty statistics
+def newStatistics():
+
+    stats = {}
+    stats["nominals"] = 0
+
+    #One row of numPositions counts for every root length, in one
+    #flat array per form
+    stats["stressByRootLength"] = {f: array("q", [0]) * ((maxLength + 1) * numPositions) for f in forms}
+    stats["stressShift"] = Counter()
+    stats["vowels"] = {f: Counter() for f in forms}
+    stats["templates"] = {f: Counter() for f in forms}
+
+    return stats
+
+#This function takes a phonological form and returns the position of
+#its stress (see numPositions above) and the length of its root. The
+#prefix of the definite is its first segment, and the suffix of the
+#indefinite is its last segment.
+def stressPosition(phon, form):
+
+    if form == "definite":
+
+        root = phon[1:]
+        offset = 1
+
+    else:
+
+        root = phon[:-1]
+        offset = 0
+
+    for i in range(len(phon)):
+
+        if phon[i] in ["A", "Y"]:
+
+            #Position within the root, counting from 1
+            position = i - offset + 1
+
+            if position < 1:
+
+                return [0, len(root)]
+
+            if position > len(root):
+
+                return [maxLength + 1, len(root)]
+
+            return [min(position, maxLength), len(root)]
+
+    return [None, len(root)]
+
+#This function returns the CV template of a phonological form, with
+#forms longer than maxLength + 1 segments cut off, so that there is a
+#bounded number of templates
+def cvTemplate(phon):
+
+    template = "".join(["C" if s == "C" else "V" for s in phon[:maxLength + 1]])
+
+    return template + "+" if len(phon) > maxLength + 1 else template
+
+#This function adds one corpus line to the statistics
+def addNominal(stats, line):
+
+    defOrth, defPhon, indfOrth, indfPhon = line.split(" ")
+    positions = {}
+
+    for f, phon in zip(forms, [defPhon, indfPhon]):
+
+        position, rootLength = stressPosition(phon, f)
+        positions[f] = position
+
+        if position is not None:
+
+            stats["stressByRootLength"][f][min(rootLength, maxLength) * numPositions + position] += 1
+
+        stats["templates"][f][cvTemplate(phon)] += 1
+
+        for v in vowels:
+
+            stats["vowels"][f][v] += phon.count(v)
+
+    #Does the stress stay on the same segment of the root?
+    if positions["definite"] == positions["indefinite"]:
+
+        stats["stressShift"]["same"] += 1
+
+    else:
+
+        stats["stressShift"]["shifted"] += 1
+
+    stats["nominals"] += 1
+
+#This function returns a hash of the corpus file, read in blocks
+def corpusHash(fileName):
+
+    h = hashlib.sha256()
+
+    with open(fileName, mode = "rb") as f:
+
+        for block in iter(lambda: f.read(1 << 20), b""):
+
+            h.update(block)
+
+    return h.hexdigest()
+
+#This function turns statistics into a dictionary which can be saved
+#as JSON, with readable labels for the stress positions
+def exportStatistics(stats, corpus):
+
+    export = {"corpus": corpus, "nominals": stats["nominals"]}
+    export["stressByRootLength"] = {}
+
+    for f in forms:
+
+        table = {}
+        histogram = stats["stressByRootLength"][f]
+
+        for rootLength in range(maxLength + 1):
+
+            row = {}
+
+            for position in range(numPositions):
+
+                count = histogram[rootLength * numPositions + position]
+
+                if count:
+
+                    row[positionLabel(position)] = count
+
+            if row:
+
+                table[f"{rootLength}+" if rootLength == maxLength else str(rootLength)] = row
+
+        export["stressByRootLength"][f] = table
+
+    shifted = stats["stressShift"]["shifted"]
+    export["stressShift"] = {"same": stats["stressShift"]["same"], "shifted": shifted, "rate": shifted / stats["nominals"] if stats["nominals"] else 0}
+    export["vowels"] = {f: dict(stats["vowels"][f]) for f in forms}
+    export["templates"] = {f: dict(stats["templates"][f].most_common()) for f in forms}
+
+    return export
+
+#A readable label for a stress position
+def positionLabel(position):
+
+    if position == 0:
+
+        return "prefix"
+
+    if position == maxLength + 1:
+
+        return "suffix"
+
+    return f"{maxLength}+" if position == maxLength else str(position)
+
+#This function returns a hash of this module's code and settings, so
+#that cached statistics computed by other versions aren't used
+def statisticsVersion():
+
+    h = hashlib.sha256()
+
+    with open(__file__, mode = "rb") as f:
+
+        h.update(f.read())
+
+    h.update(str(maxLength).encode("ascii"))
+
+    return h.hexdigest()[:16]
+
+#This function computes the statistics for a corpus file in one pass,
+#hashing the file as it goes
+def computeStatistics(fileName):
+
+    stats = newStatistics()
+    h = hashlib.sha256()
+
+    with open(fileName, mode = "rb") as f:
+
+        for line in f:
+
+            h.update(line)
+            line = line.decode("utf-8").rstrip("\r\n")
+
+            if line:
+
+                addNominal(stats, line)
+
+    return exportStatistics(stats, h.hexdigest())
+
+#This function returns the statistics for a corpus file, loading them
+#from cacheDirectory if they have already been computed for the file
+#as it is now, and computing and saving them there otherwise. The
+#cache index records the size, modification time and hash of every
+#corpus file seen, so a cached file is found without reading the
+#corpus, and a changed one is only read once.
+def cachedStatistics(fileName, cacheDirectory):
+
+    version = statisticsVersion()
+    indexFile = os.path.join(cacheDirectory, "index.json")
+    path = os.path.abspath(fileName)
+    info = os.stat(fileName)
+    index = {}
+
+    if os.path.exists(indexFile):
+
+        with open(indexFile, encoding = "utf-8") as f:
+
+            index = json.load(f)
+
+    if path in index and index[path][:2] == [info.st_size, info.st_mtime_ns]:
+
+        cacheFile = os.path.join(cacheDirectory, f"{index[path][2]}-{version}.json")
+
+        if os.path.exists(cacheFile):
+
+            with open(cacheFile, encoding = "utf-8") as f:
+
+                return json.load(f)
+
+    export = computeStatistics(fileName)
+
+    os.makedirs(cacheDirectory, exist_ok = True)
+    writeJson(export, os.path.join(cacheDirectory, f"{export['corpus']}-{version}.json"))
+
+    index[path] = [info.st_size, info.st_mtime_ns, export["corpus"]]
+    writeJson(index, indexFile)
+
+    return export
+
+#This function saves statistics as JSON
+def writeJson(export, fileName):
+
+    with open(fileName, mode = "w", encoding = "utf-8") as f:
+
+        json.dump(export, f, ensure_ascii = False, indent = 1)
+
+#This function saves statistics as CSV, with one row per count:
+#statistic, form, key, subkey, value
+#e.g. stressByRootLength, definite, 3, prefix, 41
+def writeCsv(export, fileName):
+
+    with open(fileName, mode = "w", encoding = "utf-8", newline = "") as f:
+
+        writer = csv.writer(f)
+        writer.writerow(["statistic", "form", "key", "subkey", "value"])
+        writer.writerow(["nominals", "", "", "", export["nominals"]])
+
+        for form in forms:
+
+            for rootLength, row in export["stressByRootLength"][form].items():
+
+                for position, count in row.items():
+
+                    writer.writerow(["stressByRootLength", form, rootLength, position, count])
+
+        for key, value in export["stressShift"].items():
+
+            writer.writerow(["stressShift", "", key, "", value])
+
+        for form in forms:
+
+            for v, count in export["vowels"][form].items():
+
+                writer.writerow(["vowels", form, v, "", count])
+
+            for template, count in export["templates"][form].items():
+
+                writer.writerow(["templates", form, template, "", count])
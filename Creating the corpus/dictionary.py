@@ -0,0 +1,85 @@
+import json
+import re
+
+#This module indexes the plaintext version of Yanagisawa (2010) by the
+#tags written in square brackets, such as the parts of speech [n.],
+#[adj.] or [v.]. The index maps every tag to the byte offsets of the
+#lines containing it, and is built in a single pass over the dictionary.
+#Any subcorpus (nominals, verbs, adverbs, ...) can then be read straight
+#from the index, seeking to just the lines it needs, without going
+#through the whole dictionary again.
+
+#A tag is anything in square brackets (without nested brackets)
+tagPattern = re.compile(r"\[[^\[\]]*\]")
+
+#This function reads through the dictionary once, and returns a
+#dictionary from each tag (e.g. "[n.]") to a list of the byte offsets
+#of the lines containing it, in the order they appear
+def buildTagIndex(fileName):
+
+    index = {}
+    offset = 0
+
+    with open(fileName, mode = "rb") as f:
+
+        for line in f:
+
+            #A tag that appears twice on a line is only indexed once
+            for tag in set(tagPattern.findall(line.decode("utf-8"))):
+
+                index.setdefault(tag, []).append(offset)
+
+            offset += len(line)
+
+    return index
+
+#This function saves a tag index as JSON
+def saveTagIndex(index, fileName):
+
+    with open(fileName, mode = "w", encoding = "utf-8") as f:
+
+        json.dump(index, f, ensure_ascii = False)
+
+#This function loads a tag index saved by saveTagIndex
+def loadTagIndex(fileName):
+
+    with open(fileName, encoding = "utf-8") as f:
+
+        return json.load(f)
+
+#This function returns the offsets of all lines with at least one of
+#the tags (e.g. ["[n.]", "[adj.]"]), in the order they appear in the
+#dictionary
+def tagOffsets(index, tags):
+
+    offsets = set()
+
+    for tag in tags:
+
+        offsets.update(index.get(tag, []))
+
+    return sorted(offsets)
+
+#This function lazily reads the lines at the given byte offsets from
+#the dictionary, yielding them one at a time without the final newline
+#(\n or \r\n, as when reading the file in text mode)
+def readLines(fileName, offsets):
+
+    with open(fileName, mode = "rb") as f:
+
+        for offset in offsets:
+
+            f.seek(offset)
+
+            yield f.readline().decode("utf-8").removesuffix("\n").removesuffix("\r")
+
+#This function lazily yields the lines of the dictionary which contain
+#at least one of the tags. If prefixes is given (e.g. ["a-", "a¡-"]),
+#only lines starting with one of the prefixes are kept.
+def selectLines(fileName, index, tags, prefixes = None):
+
+    for line in readLines(fileName, tagOffsets(index, tags)):
+
+        if prefixes is None or line.startswith(tuple(prefixes)):
+
+            yield line
@@ -0,0 +1,126 @@
+import unicodedata
+from collections import Counter
+
+import transcription
+
+#The dictionary is in a mangled text encoding (¡, º, ≈, ˙, ∞, ç, ...),
+#and any symbol not covered by the conversion rules in transcription.py
+#is silently left as it is. This module finds such symbols. It builds a
+#table of the characters we know about, reads the input once in large
+#chunks, blanks out the rules longer than one character (e.g. a¡),
+#deletes every known character from each chunk with translate, and
+#counts whatever is left over. A character which is only converted as
+#part of a longer rule (¡) is therefore reported wherever it occurs
+#outside of that rule.
+
+#Characters which aren't converted, but which are expected in the
+#input: whitespace, and the punctuation and digits script 2 separates
+#from words
+layoutCharacters = " \t\r\n.,()[]=/0123456789"
+
+#Unicode ranges of the Japanese glosses in the dictionary, which are
+#never part of a form: CJK punctuation, Hiragana and Katakana; CJK
+#ideographs; fullwidth forms
+glossRanges = [(0x3000, 0x30FF), (0x3400, 0x9FFF), (0xFF00, 0xFFEF)]
+
+#This function returns a dictionary from every known character to its
+#class: "conversion" for characters covered by the conversion rules,
+#"layout" for layoutCharacters, and "gloss" for the glossRanges.
+#Characters in extra (a string) are added as "ignored".
+def characterClasses(extra = ""):
+
+    classes = {}
+
+    for start, stop in glossRanges:
+
+        for code in range(start, stop + 1):
+
+            classes[chr(code)] = "gloss"
+
+    for c in layoutCharacters:
+
+        classes[c] = "layout"
+
+    for c in extra:
+
+        classes[c] = "ignored"
+
+    for symbol in transcription.orthIn + transcription.phonIn:
+
+        if len(symbol) == 1:
+
+            classes[symbol] = "conversion"
+
+    return classes
+
+#This function returns the conversion rules longer than one character
+#in UTF-8, longest first, each with a blank of the same length in bytes
+#to replace it with (so byte offsets stay the same)
+def multiCharacterRules():
+
+    symbols = sorted(set([s for s in transcription.orthIn + transcription.phonIn if len(s) > 1]), key = lambda s: -len(s))
+
+    return [[s.encode("utf-8"), b" " * len(s.encode("utf-8"))] for s in symbols]
+
+#This function returns two tables for deleting every character in
+#classes: a bytes.translate deletion string for the ASCII characters,
+#and a str.translate table for the rest
+def deletionTables(classes):
+
+    asciiBytes = bytes(sorted([ord(c) for c in classes if ord(c) < 128]))
+
+    return [asciiBytes, str.maketrans({c: None for c in classes if ord(c) >= 128})]
+
+#This function reads a file once, in chunks of about chunkSize bytes
+#ending at the end of a line, and returns [numBytes, unmapped], where
+#unmapped is a dictionary from every character without a class to
+#[frequency, offsets], with the byte offsets of its first maxSamples
+#occurrences. Most of the input is ASCII, so known ASCII characters are
+#deleted from the raw bytes first (ASCII bytes never occur inside the
+#UTF-8 encoding of another character), and only what is left over is
+#decoded and checked character by character.
+def auditFile(fileName, extra = "", chunkSize = 1 << 22, maxSamples = 3):
+
+    asciiBytes, table = deletionTables(characterClasses(extra))
+    rules = multiCharacterRules()
+    counts = Counter()
+    samples = {}
+    numBytes = 0
+
+    with open(fileName, mode = "rb") as f:
+
+        for chunk in iter(lambda: f.read(chunkSize) + f.readline(), b""):
+
+            #Blank out the longer rules before anything is deleted
+            for symbol, blank in rules:
+
+                chunk = chunk.replace(symbol, blank)
+
+            left = chunk.translate(None, asciiBytes).decode("utf-8").translate(table)
+
+            if left:
+
+                counts.update(left)
+
+                #Find the first occurrences of characters we haven't
+                #got enough samples for yet
+                for c in set(left):
+
+                    offsets = samples.setdefault(c, [])
+                    encoded = c.encode("utf-8")
+                    position = chunk.find(encoded) if len(offsets) < maxSamples else -1
+
+                    while position != -1 and len(offsets) < maxSamples:
+
+                        offsets.append(numBytes + position)
+                        position = chunk.find(encoded, position + 1)
+
+            numBytes += len(chunk)
+
+    return [numBytes, {c: [counts[c], samples[c]] for c, count in counts.most_common()}]
+
+#A readable description of a character, e.g. U+00A1 INVERTED
+#EXCLAMATION MARK
+def describeCharacter(c):
+
+    return f"U+{ord(c):04X} {unicodedata.name(c, 'UNKNOWN')}"
@@ -0,0 +1,186 @@
+import transcription
+
+#This module contains the steps of scripts 2 to 4 that work on one
+#dictionary line at a time: cleaning up punctuation, finding the
+#definite and indefinite forms of a nominal, checking that their
+#stress is usable, and leaving out likely loans. The scripts run them
+#over the whole of Yanagisawa (2010), sources.py runs them over other
+#dictionaries in the same format, and corpus.py runs them all in
+#memory.
+
+#Clean up some things that would cause problems if they stuck around
+#Specifically, I add spaces around these characters, so that they
+#aren't accidentally parsed as part of an Abkhaz word
+def cleanLine(line):
+
+    for item in [".", ",", "(", ")", "1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "=", "[", "]", "/"]:
+
+        line = line.replace(item, " " + item)
+        line = line.replace(item, item + " ")
+
+    #Remove double spaces
+    while "  " in line:
+
+        line = line.replace("  ", " ")
+
+    return line
+
+#This function takes a cleaned nominal line, and tries to find both a
+#definite and an indefinite form. It returns [definite, indefinite]
+#in the mangled encoding, or None if it doesn't find both, and several
+#types of forms are removed.
+def extractPair(line):
+
+    #Double parentheses caused problems previously
+    line = line.replace(") ) ", ") ")
+
+    #Entries with morphologically related forms all have parentheses,
+    #and we want to make sure there's a possible indefinite in there
+    if not (")" in line and "-k " in line):
+
+        return None
+
+    #Variables for storing the current definite/indefinite
+    tempDef = ""
+    tempIndf = ""
+
+    #A temporary variable useful for text processing
+    tempS = line
+
+    #Some irregular/word-specific formatting for parentheses means we generally want to remove all but the last one
+    tempS = tempS.replace(") ", "", tempS.count(") ") - 1)
+
+    #Indefinites come before a right parenthesis somewhere,
+    #so we only check words before the first right parenthesis
+    tempL = tempS[:tempS.index(")")].split(" ")
+
+    #Check all words on this line for definites and indefinites
+    for i in range(len(tempL)):
+
+        #The definite is the first word (the headword)
+        #We exclude forms with stress on aa
+        if i == 0 and "a¡a" not in tempL[i] and "aa¡" not in tempL[i]:
+
+            tempDef = tempL[i]
+
+        #Look for indefinites:
+        #we look for forms with one morpheme boundary only,
+        #which end in the indefinite suffix, and
+        #we throw out forms with stress on aa
+        if tempL[i].endswith("-k") and tempL[i].count("-") == 1 and len(tempL[i]) > 2 and "a¡a" not in tempL[i] and "aa¡" not in tempL[i]:
+
+            tempIndf = tempL[i]
+
+            break
+            #Note that this only saves the first possible pronunciation,
+            #if multiple are given (but that's only done rarely).
+            #Excluding anything but the first is also generally
+            #useful to stop the corpus from containing indefinites
+            #of unrelated nouns which are used in example
+            #sentences on the same line as the headword.
+
+    #Only lines with both forms count
+    if tempDef and tempIndf:
+
+        return [tempDef, tempIndf]
+
+    return None
+
+#A helper function which takes in a form (string) and a list of
+#vowels, and counts how many vowels there are in the form.
+def countVowels(form, vowels):
+
+    sumVowels = 0
+
+    for v in vowels:
+
+        sumVowels += form.count(v)
+
+    return sumVowels
+
+#This helper function takes in a definite or indefinite form
+#and checks that it has exactly one stress marked. However,
+#monovocalic forms are also valid, even if they don't have
+#stress marked. All other forms are invalid. The function
+#returns an empty string for invalid forms, and returns
+#the form itself for valid forms, adding in stress on mono-
+#vocalic forms if needed.
+def getValid(form):
+
+    #Forms with one stress marked
+    if countVowels(form, ["A", "Y", "U", "I", "E", "O"]) == 1:
+
+            return form
+
+    #Forms with exactly one vowel and stress unmarked
+    if countVowels(form, ["a", "y", "u", "i", "e", "o"]) == 1:
+
+            #Add stress on the single vowel
+            for v in ["a", "y", "u", "i", "e", "o"]:
+
+                form = form.replace(v, v.upper())
+
+            return form
+
+    return ""
+
+#This function takes cleaned nominal lines, and lazily yields a corpus
+#record (defOrth, defPhon, indfOrth, indfPhon) for every line with a
+#definite and an indefinite form. The forms are converted to
+#orthography and phonology (see transcription.py), and words with
+#multiple stresses (only a handful) or no stresses are removed.
+def nominalRecords(lines):
+
+    pairs = (pair for pair in map(extractPair, lines) if pair)
+
+    for defOrth, defPhon, indfOrth, indfPhon in transcription.transcribeRecords(pairs):
+
+        #Check that both forms satisfy validity requirements,
+        #which are to have at most one stress marked, or
+        #to be monovocalic, such that there is only one place
+        #where the stress could go.
+        validDef = getValid(defPhon)
+        validIndf = getValid(indfPhon)
+
+        #If both forms are valid, keep them. Note that I only
+        #add in stresses in the phonological representations,
+        #I don't care to add them in in the orthography as well.
+        if validDef and validIndf:
+
+            yield (defOrth, validDef, indfOrth, validIndf)
+
+#Two items are parsed incorrectly: one is Азна 'full (of)', which
+#has no indefinite form in the dictionary, but which does have an
+#example phrase which happens to start with the indefinite of another
+#noun, and this incorrectly gets included. The other is written
+#аҳә(ы)сҭА ҳә(ы)сҭАк in the dictionary, and the parentheses mess with
+#everything. This function lazily goes through the records of
+#Yanagisawa (2010), excluding 'full (of)', but keeping the other word,
+#adding its information manually.
+def fixRecords(records):
+
+    for record in records:
+
+        if record == ("Азна", "ACCa", "ҵәык", "CYC"):
+
+            continue
+
+        if record == ("аҳә", "AC", "сҭАк", "CCAC"):
+
+            record = ("аҳәысҭА", "aCyCCA", "ҳәысҭАк", "CyCCAC")
+
+        yield record
+
+#This function checks that a corpus line or record has none of the
+#non-native graphemes i e o u. It's better to look for the Cyrillic
+#letters (и е о у), since some of и у are treated as C rather than
+#I U in the phonological transcription. Note that there are native
+#words containing these graphemes, and non-native words which do not
+#contain them.
+def isNative(nominal):
+
+    if not isinstance(nominal, str):
+
+        nominal = " ".join(nominal)
+
+    return not True in [bool(v in nominal.lower()) for v in ["и", "е", "о", "у"]]
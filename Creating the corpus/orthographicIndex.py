@@ -0,0 +1,302 @@
+import mmap
+import os
+from array import array
+
+import corpus
+import corpusStats
+
+#This module builds a search index over the orthography of the corpus
+#(the definite and the indefinite of every record), so that we can find
+#every nominal containing, starting with or ending in some letters
+#without going through the whole corpus. The index is a suffix array:
+#the orthographic forms are joined into one text, each between a start
+#mark and an end mark, and the suffix array lists the positions of the
+#text in the alphabetical order of the text starting there. All
+#suffixes starting with a pattern are then next to each other in the
+#suffix array, and two binary searches find them, in time proportional
+#to the length of the pattern (times the logarithm of the size of the
+#corpus), plus the number of matches. Prefixes and suffixes are found
+#by adding the start or end mark to the pattern.
+#
+#For stress-insensitive searches, there is a second suffix array over
+#the text in lowercase (stress is marked by uppercase vowels in the
+#orthography). Everything a search needs is saved in one file beside
+#the corpus, and mapped into memory when it is opened, so a search
+#doesn't read or parse the corpus, and only touches the parts of the
+#index it looks at. The index file records the size, modification time
+#and hash of the corpus it was built from, and is built again when the
+#corpus changes.
+#
+#The index file consists of a header (the size and modification time of
+#the corpus, the number of characters in the text, the number of
+#records and the size of the records in bytes, as 8-byte integers,
+#followed by the SHA-256 hash of the corpus), then the two suffix
+#arrays, the record of every character of the text and the offsets of
+#the records (all 8-byte integers), then the text and the lowercase
+#text in UTF-32-BE, and the records in UTF-8. In UTF-32-BE, comparing
+#the bytes of two strings gives the same order as comparing the
+#strings, and the character at position i is at byte 4 * i.
+
+startMark = "\x02"
+endMark = "\x03"
+
+#The columns of a record which are indexed
+orthographyColumns = [0, 2]
+
+headerFields = 5
+hashSize = 32
+headerSize = 8 * headerFields + hashSize
+
+#This function builds the suffix array of a text, by sorting the
+#suffixes on their first 1, 2, 4, ... characters until they all differ
+#(prefix doubling)
+def suffixArray(text):
+
+    n = len(text)
+    suffixes = sorted(range(n), key = lambda i: text[i])
+
+    #ranks[i]: the order of the suffix starting at i by the characters
+    #sorted on so far (equal suffixes have equal ranks)
+    ranks = [0] * n
+
+    for k in range(1, n):
+
+        ranks[suffixes[k]] = ranks[suffixes[k - 1]] + (text[suffixes[k]] != text[suffixes[k - 1]])
+
+    length = 1
+
+    while n and ranks[suffixes[-1]] < n - 1:
+
+        #Sort on the first 2 * length characters: the rank of the first
+        #length characters, then the rank of the next length characters
+        key = lambda i: (ranks[i], ranks[i + length] if i + length < n else -1)
+        suffixes.sort(key = key)
+
+        newRanks = [0] * n
+
+        for k in range(1, n):
+
+            newRanks[suffixes[k]] = newRanks[suffixes[k - 1]] + (key(suffixes[k]) != key(suffixes[k - 1]))
+
+        ranks = newRanks
+        length *= 2
+
+    return array("q", suffixes)
+
+#This function builds the index of a list of records (defOrth, defPhon,
+#indfOrth, indfPhon) and saves it to fileName, atomically (as with
+#checkpoints), together with the size, modification time (in ns) and
+#hash of the corpus file it was built from
+def writeIndex(records, fileName, corpusSize, corpusTime, corpusHash):
+
+    words = []
+    owners = array("q")
+
+    for r in range(len(records)):
+
+        for column in orthographyColumns:
+
+            word = startMark + records[r][column] + endMark
+            words.append(word)
+            owners.extend([r] * len(word))
+
+    #owners[i]: the record the character at position i is from
+    text = "".join(words)
+    foldedText = text.lower()
+
+    recordOffsets = array("q", [0])
+    recordBytes = bytearray()
+
+    for record in records:
+
+        recordBytes += " ".join(record).encode("utf-8")
+        recordOffsets.append(len(recordBytes))
+
+    tempFileName = fileName + ".tmp"
+
+    with open(tempFileName, mode = "wb") as f:
+
+        f.write(array("q", [corpusSize, corpusTime, len(text), len(records), len(recordBytes)]).tobytes())
+        f.write(bytes.fromhex(corpusHash))
+        f.write(suffixArray(text).tobytes())
+        f.write(suffixArray(foldedText).tobytes())
+        f.write(owners.tobytes())
+        f.write(recordOffsets.tobytes())
+        f.write(text.encode("utf-32-be"))
+        f.write(foldedText.encode("utf-32-be"))
+        f.write(recordBytes)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tempFileName, fileName)
+
+#This function reads the header of an index file: [corpus size,
+#corpus modification time, hash], or None if there's no index file
+def readHeader(fileName):
+
+    if not os.path.exists(fileName):
+
+        return None
+
+    with open(fileName, mode = "rb") as f:
+
+        header = f.read(headerSize)
+
+    if len(header) < headerSize:
+
+        return None
+
+    fields = array("q", header[:8 * headerFields])
+
+    return [fields[0], fields[1], header[8 * headerFields:].hex()]
+
+class OrthographicIndex:
+
+    #Maps an index file written by writeIndex into memory read-only
+    def __init__(self, fileName):
+
+        with open(fileName, mode = "rb") as f:
+
+            self.map = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        self.view = memoryview(self.map)
+        numChars, numRecords, recordBytes = self.view[16:8 * headerFields].cast("q")
+
+        #The sections of the file, in order
+        sections = {}
+        start = headerSize
+
+        for name, size, form in [["suffixes", 8 * numChars, "q"], ["foldedSuffixes", 8 * numChars, "q"], ["owners", 8 * numChars, "q"], ["recordOffsets", 8 * (numRecords + 1), "q"], ["text", 4 * numChars, None], ["foldedText", 4 * numChars, None], ["records", recordBytes, None]]:
+
+            section = self.view[start:start + size]
+            sections[name] = section.cast(form) if form else section
+            start += size
+
+        self.sections = sections
+        self.numRecords = numRecords
+
+    def __len__(self):
+
+        return self.numRecords
+
+    #The record number r, decoded from the mapped file
+    def record(self, r):
+
+        offsets = self.sections["recordOffsets"]
+
+        return tuple(str(self.sections["records"][offsets[r]:offsets[r + 1]], "utf-8").split(" "))
+
+    #This function returns the positions in the text where pattern
+    #occurs, in the order of the suffix array
+    def occurrences(self, pattern, ignoreStress = False):
+
+        text = self.sections["foldedText" if ignoreStress else "text"]
+        suffixes = self.sections["foldedSuffixes" if ignoreStress else "suffixes"]
+        encoded = pattern.encode("utf-32-be")
+
+        #Compare only the first len(pattern) characters of every
+        #suffix, so every suffix starting with the pattern compares
+        #equal to it
+        first = bisectSuffixes(text, suffixes, encoded, lower = True)
+        last = bisectSuffixes(text, suffixes, encoded, lower = False)
+
+        return suffixes[first:last].tolist()
+
+    #This function returns the records with an orthographic form
+    #containing pattern, starting with it (kind = "prefix") or ending
+    #in it (kind = "suffix"), in corpus order. With ignoreStress = True,
+    #stressed and unstressed vowels are not told apart.
+    def search(self, pattern, kind = "substring", ignoreStress = False):
+
+        if kind not in ["substring", "prefix", "suffix"]:
+
+            raise ValueError(f"{kind} is not a kind of search (use substring, prefix or suffix)")
+
+        if ignoreStress:
+
+            pattern = pattern.lower()
+
+        if kind == "prefix":
+
+            pattern = startMark + pattern
+
+        elif kind == "suffix":
+
+            pattern += endMark
+
+        owners = self.sections["owners"]
+        matches = sorted(set([owners[i] for i in self.occurrences(pattern, ignoreStress)]))
+
+        return [self.record(r) for r in matches]
+
+    def close(self):
+
+        for section in self.sections.values():
+
+            section.release()
+
+        self.view.release()
+        self.map.close()
+
+#This function finds the first position in the suffix array whose
+#suffix, cut to the length of the pattern, is not less than the
+#pattern (lower = True), or greater than it (lower = False). The text
+#and the pattern are in UTF-32-BE.
+def bisectSuffixes(text, suffixes, pattern, lower):
+
+    low = 0
+    high = len(suffixes)
+
+    while low < high:
+
+        middle = (low + high) // 2
+        start = 4 * suffixes[middle]
+        prefix = text[start:start + len(pattern)].tobytes()
+
+        if prefix < pattern or (not lower and prefix == pattern):
+
+            low = middle + 1
+
+        else:
+
+            high = middle
+
+    return low
+
+#The file the index of a corpus file is saved to
+def indexFileName(corpusFileName):
+
+    return os.path.splitext(corpusFileName)[0] + ".index"
+
+#This function opens the index of a corpus file (e.g. 4. Nominal corpus
+#(no loans).txt), building and saving it first if there is no index
+#for the current version of the corpus. If the size and modification
+#time of the corpus are those in the index, the corpus isn't read at
+#all; otherwise it is hashed, and only parsed if the hash differs.
+def loadIndex(corpusFileName):
+
+    fileName = indexFileName(corpusFileName)
+    info = os.stat(corpusFileName)
+    header = readHeader(fileName)
+
+    if header and header[:2] == [info.st_size, info.st_mtime_ns]:
+
+        return OrthographicIndex(fileName)
+
+    corpusHash = corpusStats.corpusHash(corpusFileName)
+
+    #The corpus was touched, but not changed: record its new
+    #modification time
+    if header and header[2] == corpusHash and header[0] == info.st_size:
+
+        with open(fileName, mode = "r+b") as f:
+
+            f.seek(8)
+            f.write(array("q", [info.st_mtime_ns]).tobytes())
+
+        return OrthographicIndex(fileName)
+
+    records = corpus.loadCorpus(corpusFileName).records
+    writeIndex(records, fileName, info.st_size, info.st_mtime_ns, corpusHash)
+
+    return OrthographicIndex(fileName)
@@ -0,0 +1,133 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import dictionary
+import nominalPairs
+
+#This module builds one corpus from several dictionaries in the same
+#plaintext format as Yanagisawa (2010). Every source is run through the
+#same steps as scripts 1 to 3 (see dictionary.py and nominalPairs.py),
+#in parallel, which converts its forms to orthography and phonology.
+#The records are then joined on their headword: a dictionary from each
+#headword to the records every source has for it is built in one pass,
+#so merging takes time linear in the number of records. Where sources
+#disagree about a headword, the first source listed wins, and the
+#disagreement is reported. A source with the same record more than
+#once, or with several different records for a headword, is reported
+#too.
+
+#Nominal lines have one of these tags, and start with the article
+#(as in script 1)
+nominalTags = ["[n.]", "[adj.]"]
+nominalPrefixes = ["a-", "a¡-"]
+
+#This function reads one dictionary and returns its corpus records
+#(defOrth, defPhon, indfOrth, indfPhon), in dictionary order
+def readSource(fileName):
+
+    tagIndex = dictionary.buildTagIndex(fileName)
+    lines = dictionary.selectLines(fileName, tagIndex, nominalTags, nominalPrefixes)
+
+    return list(nominalPairs.nominalRecords(nominalPairs.cleanLine(line) for line in lines))
+
+#This function reads several dictionaries, in up to workers processes
+#at once, and returns a list of their records in the same order
+def readSources(fileNames, workers = 1):
+
+    if workers == 1:
+
+        return [readSource(fileName) for fileName in fileNames]
+
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+
+        return list(executor.map(readSource, fileNames))
+
+#The headword of a record: its definite in orthography, without stress
+#(e.g. абӷьыц)
+def headword(record):
+
+    return record[0].lower()
+
+#This function takes a list of source names and a list with the
+#records of each source, and joins them on their headwords. It returns
+#[merged, conflicts]. merged has the records for every headword from
+#the first source that has it, in the order the headwords first appear.
+#conflicts has an entry [headword, kind, readings] for every headword
+#with a conflict, where readings is a dictionary from each source
+#involved to its records for the headword. kind is "stress" if the
+#sources only disagree on where the stress is, "form" if they disagree
+#otherwise, "duplicate" if a source has the same record more than once
+#(it only counts once), and "variants" if a source has several
+#different records for the headword (they are all kept). The order in
+#which a source lists its records doesn't matter. Source names must be
+#different.
+def mergeSources(names, sourceRecords):
+
+    if len(set(names)) < len(names):
+
+        raise ValueError("the same source is listed more than once")
+
+    joined = {}
+    duplicates = set()
+
+    for name, records in zip(names, sourceRecords):
+
+        for record in records:
+
+            readings = joined.setdefault(headword(record), {}).setdefault(name, [])
+
+            #The same record twice in one source only counts once
+            if record in readings:
+
+                duplicates.add((headword(record), name))
+
+            else:
+
+                readings.append(record)
+
+    merged = []
+    conflicts = []
+
+    for key, readings in joined.items():
+
+        merged.extend(next(iter(readings.values())))
+
+        for name, records in readings.items():
+
+            if (key, name) in duplicates:
+
+                conflicts.append([key, "duplicate", {name: records}])
+
+            if len(records) > 1:
+
+                conflicts.append([key, "variants", {name: records}])
+
+        if len(set([frozenset(records) for records in readings.values()])) > 1:
+
+            #Do the readings agree once stress is left out?
+            unstressed = set([frozenset([tuple([form.lower() for form in record]) for record in records]) for records in readings.values()])
+            kind = "stress" if len(unstressed) == 1 else "form"
+
+            conflicts.append([key, kind, readings])
+
+    return [merged, conflicts]
+
+#This function saves records in the format of 3. Nominal corpus.txt
+def writeCorpus(records, fileName):
+
+    with open(fileName, mode = "w", encoding = "utf-8") as f:
+
+        f.write("\n".join([" ".join(record) for record in records]))
+
+#This function saves the conflicts from mergeSources, with one line per
+#headword: the headword, the kind of conflict, and the records from
+#every source, separated by tabs, e.g.
+#абӷьыц	stress	A.txt: абӷьЫц aCCYC бӷьЫцк CCYCC	B.txt: ...
+def writeConflicts(conflicts, fileName):
+
+    with open(fileName, mode = "w", encoding = "utf-8") as f:
+
+        for key, kind, readings in conflicts:
+
+            sources = [f"{name}: " + ", ".join([" ".join(record) for record in records]) for name, records in readings.items()]
+
+            f.write("\t".join([key, kind] + sources) + "\n")
@@ -0,0 +1,149 @@
+#This module converts nominals from the mangled text encoding of the
+#dictionary into several tiers at once: standard Abkhaz orthography,
+#the simplified phonological transcription (C for every consonant,
+#with vowel qualities and stress kept distinct), and a consonant class
+#tier which keeps the place and manner of each consonant instead of C.
+#Each form is read once, symbol by symbol, and every tier is built
+#during the same pass, so the tiers of a form always line up.
+
+#Stressed vowels are written as a vowel followed by ¡
+stressedVowels = ["a¡", "y¡", "u¡", "i¡", "e¡", "o¡"]
+
+#These convert to standard Abkhaz orthography
+orthIn = ["a¡", "y¡", "u¡", "i¡", "e¡", "o¡", ";", "´", "ә", "ь", "b", "v", "g", "ҕ", "d", "'", "z", "ӡ", "k", "º", "ҟ", "l", "m", "n", "p", "ҧ", "r", "s", "t", "ҭ", "f", "x", "≈", "c", "ҵ", "h", "˙", "ҽ", "w", "ҩ", "ҿ", "ç", "∞", "-", "a", "y", "e", "o", "i", "u"]
+orthOt = ["А", "Ы", "У", "И", "Е", "О", "ь", "ә", "ә", "ь", "б", "в", "г", "ӷ", "д", "ж", "з", "ӡ", "к", "қ", "ҟ", "л", "м", "н", "п", "ԥ", "р", "с", "т", "ҭ", "ф", "х", "ҳ", "ц", "ҵ", "ч", "ҷ", "ҽ", "ш", "ҩ", "ҿ", "џ", "ҕ", "", "а", "ы", "е", "о", "и", "у"]
+
+#These convert to simplified phonological transcriptions. The same
+#character is used for i & j, and for u & w, so i and u are left as
+#they are here, and decided on by the context rules below.
+phonIn = ["a¡", "y¡", "u¡", "i¡", "e¡", "o¡", ";", "´", "ә", "ь", "b", "v", "g", "ҕ", "d", "'", "z", "ӡ", "k", "º", "ҟ", "l", "m", "n", "p", "ҧ", "r", "s", "t", "ҭ", "f", "x", "≈", "c", "ҵ", "h", "˙", "ҽ", "w", "ҩ", "ҿ", "ç", "∞", "-", "a", "y", "e", "o"]
+phonOt = ["A", "Y", "U", "I", "E", "O", "", "", "", "", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "C", "", "a", "y", "e", "o"]
+
+#These attempt to deal with the same character being used for i & j,
+#and for u & w: i and u are vowels between consonants, and next to a
+#consonant at the edge of a form, and glides (C) otherwise. They are
+#applied in order to a whole record, written as "\n" + definite + " "
+#+ indefinite + "\n", after the phonology above. This is nice to have,
+#but in future scripts, I will discard the relevant words as possible
+#loanwords anyway.
+contextIn = ["CiC", "\niC", " iC", "Ci ", "Ci\n", "i", "и", "CuC", " uC", "Cu ", "u", "Cw\n", "\nwC", "w", "у"]
+contextOt = ["CиC", "\nиC", " иC", "Cи ", "Cи\n", "C", "i", "CуC", " уC", "Cу ", "w", "Cу\n", "\nуC", "C", "u"]
+
+#Consonant classes by place and manner, for the consonant class tier:
+#P labial stop, F labial fricative, M labial nasal, T alveolar stop,
+#Z alveolar affricate, S alveolar fricative, N alveolar nasal,
+#L lateral, R rhotic, Č postalveolar affricate, Š postalveolar
+#fricative, K velar stop, Q uvular stop, G dorsal fricative,
+#H pharyngeal fricative, W labial glide, J palatal glide.
+#Labialization and palatalization are left out, as in the phonology.
+consonantClasses = {"b": "P", "p": "P", "ҧ": "P", "v": "F", "f": "F", "m": "M", "d": "T", "t": "T", "ҭ": "T", "ӡ": "Z", "c": "Z", "ҵ": "Z", "z": "S", "s": "S", "n": "N", "l": "L", "r": "R", "h": "Č", "˙": "Č", "ҽ": "Č", "ҿ": "Č", "ç": "Č", "'": "Š", "w": "Š", "g": "K", "k": "K", "º": "K", "ҟ": "Q", "ҕ": "G", "x": "G", "∞": "G", "≈": "H", "ҩ": "W"}
+glideClasses = {"i": "J", "u": "W"}
+
+tiers = ["orthography", "phonology", "consonantClass"]
+
+orthMap = dict(zip(orthIn, orthOt))
+phonMap = dict(zip(phonIn, phonOt))
+
+#This function splits a form in the mangled encoding into its symbols:
+#single characters, except for stressed vowels, which are two
+def symbols(form):
+
+    i = 0
+
+    while i < len(form):
+
+        if form[i:i + 2] in stressedVowels:
+
+            yield form[i:i + 2]
+            i += 2
+
+        else:
+
+            yield form[i]
+            i += 1
+
+#This function reads a form once, and returns its orthography, its
+#phonology before the context rules, and a list with the source symbol
+#behind each character of that phonology
+def readForm(form):
+
+    orth = []
+    phon = []
+    sources = []
+
+    for s in symbols(form):
+
+        orth.append(orthMap.get(s, s))
+        p = phonMap.get(s, s)
+
+        if p:
+
+            phon.append(p)
+            sources.append(s)
+
+    return ["".join(orth), "".join(phon), sources]
+
+#This function applies the context rules to the phonology of a record
+#(definite and indefinite), and returns the two forms. Every rule
+#replaces one character by another, so the characters of the result
+#line up with those of the input.
+def applyContext(defPhon, indfPhon):
+
+    record = f"\n{defPhon} {indfPhon}\n"
+
+    for i in range(len(contextIn)):
+
+        record = record.replace(contextIn[i], contextOt[i])
+
+    return record[1:-1].split(" ")
+
+#This function builds the consonant class tier of a form from its final
+#phonology and the source symbol behind each character
+def consonantClassForm(phon, sources):
+
+    classes = []
+
+    for p, s in zip(phon, sources):
+
+        if s in consonantClasses:
+
+            classes.append(consonantClasses[s])
+
+        #i or u which turned out to be a glide
+        elif p == "C":
+
+            classes.append(glideClasses.get(s, "C"))
+
+        else:
+
+            classes.append(p)
+
+    return "".join(classes)
+
+#This function takes a definite and an indefinite in the mangled
+#encoding, and returns a tuple with the requested tiers (see tiers
+#above) of the definite, followed by the same tiers of the indefinite,
+#e.g. (defOrth, defPhon, indfOrth, indfPhon)
+def transcribeRecord(definite, indefinite, requested = ["orthography", "phonology"]):
+
+    defOrth, defPhon, defSources = readForm(definite)
+    indfOrth, indfPhon, indfSources = readForm(indefinite)
+    defPhon, indfPhon = applyContext(defPhon, indfPhon)
+
+    forms = {}
+    forms["orthography"] = [defOrth, indfOrth]
+    forms["phonology"] = [defPhon, indfPhon]
+
+    if "consonantClass" in requested:
+
+        forms["consonantClass"] = [consonantClassForm(defPhon, defSources), consonantClassForm(indfPhon, indfSources)]
+
+    return tuple([forms[t][0] for t in requested] + [forms[t][1] for t in requested])
+
+#This function lazily transcribes a sequence of [definite, indefinite]
+#pairs, yielding one tuple per record
+def transcribeRecords(records, requested = ["orthography", "phonology"]):
+
+    for definite, indefinite in records:
+
+        yield transcribeRecord(definite, indefinite, requested)
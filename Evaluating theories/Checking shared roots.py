@@ -0,0 +1,35 @@
+import argparse
+
+import dybo
+import rootConsistency
+
+#This script takes a corpus of Abkhaz nominal forms as input, and
+#finds groups of nominals sharing a root: the same root listed more
+#than once, or a root making up the beginning of another nominal's
+#root (see rootConsistency.py). For every group, it checks whether
+#there is one accentuation of the shared material under which Dybo's
+#Rule predicts every form in the group correctly, and prints the
+#groups for which there isn't.
+
+parser = argparse.ArgumentParser(description = "Check that nominals sharing a root can share its accents.")
+parser.add_argument("--scheme", choices = list(dybo.schemes), default = "elements", help = "segmentation scheme")
+parser.add_argument("--min-prefix", type = int, default = 2, help = "minimum number of elements in a root to link it to longer roots")
+args = parser.parse_args()
+
+#Load the corpus data, adding morpheme boundaries and glosses
+nominals = dybo.loadNominals("10. C(V)C(V)C(V), UUU.txt")
+
+groups = rootConsistency.checkSharedRoots(nominals, args.scheme, args.min_prefix)
+inconsistent = 0
+
+for members, consistent in groups:
+
+    if not consistent:
+
+        print("NO CONSISTENT ACCENTUATION: " + ", ".join([f"{nominals[i][-2]} {nominals[i][-1]}" for i in members]))
+
+        inconsistent += 1
+
+print(f"Groups of nominals sharing a root: {len(groups)}")
+print(f"Groups with no consistent accentuation: {inconsistent}")
+print(f"Nominals in groups: {sum([len(members) for members, consistent in groups])}")
@@ -0,0 +1,30 @@
+import dybo
+import theories
+
+#This script evaluates every theory registered in theories.py (Dybo's
+#Rule and the baselines it is compared against) under every
+#segmentation scheme, side by side. For each theory and scheme it asks
+#whether there is any underlying representation of the root such that
+#the theory predicts the correct stress pattern, as the Evaluating
+#Dybo's Rule scripts do for Dybo's Rule, and prints the totals.
+#To evaluate a new theory, register it in theories.py.
+
+#Specify the accent of each functional morpheme
+#A = accented, U = unaccented
+dybo.accentStatus["DEF"] = "A"
+dybo.accentStatus["INDF"] = "U"
+
+#Load the corpus data, adding morpheme boundaries and glosses
+nominals = dybo.loadNominals("10. C(V)C(V)C(V), UUU.txt")
+
+for scheme in dybo.schemes:
+
+    evaluations = theories.evaluateTheories(nominals, scheme)
+
+    for name, [results, classResults] in evaluations.items():
+
+        evaluated = [r for r in results if r is not None]
+        totalCorrect = sum([r[0].count(1) for r in evaluated])
+        nominalsCorrect = len([r for r in evaluated if r[0].count(1) == 2])
+
+        print(f"{scheme}, {name}: {totalCorrect}/{2 * len(evaluated)} forms, {nominalsCorrect}/{len(evaluated)} nominals with 2/2 correct predictions")
@@ -0,0 +1,70 @@
+import bootstrap
+import dybo
+
+#This script evaluates Dybo's Rule under every segmentation scheme,
+#and adds uncertainty to the totals: bootstrap confidence intervals
+#for the proportion of nominals with 2/2 correct predictions and of
+#forms correctly predicted, paired comparisons between the schemes,
+#and 10-fold cross-validation of the learned affix accents.
+#It needs numpy (see bootstrap.py).
+
+#Number of bootstrap resamples, and number of worker processes to
+#split them across
+numResamples = 10000
+workers = 1
+
+#Fix the seed so the intervals are the same from run to run
+seed = 2024
+
+#The functional morphemes whose accent we want to learn
+morphemes = ["DEF", "INDF"]
+
+#The script runs in main(), so that the worker processes the bootstrap
+#is split across, which import this file where processes are spawned
+#rather than forked (e.g. on Windows and macOS), don't run it again
+def main():
+
+    #Load the corpus data, adding morpheme boundaries and glosses
+    nominals = dybo.loadNominals("10. C(V)C(V)C(V), UUU.txt")
+
+    scores = {}
+
+    for scheme in dybo.schemes:
+
+        results, classResults = dybo.evaluateNominals(nominals, scheme)
+        scores[scheme] = bootstrap.scoresFromResults(results)
+
+        mean, lower, upper = bootstrap.confidenceInterval(scores[scheme] == 2, numResamples, seed = seed, workers = workers)
+        print(f"{scheme}: nominals with 2/2 correct predictions: {mean:.3f} [{lower:.3f}, {upper:.3f}]")
+
+        mean, lower, upper = bootstrap.confidenceInterval(scores[scheme] / 2, numResamples, seed = seed, workers = workers)
+        print(f"{scheme}: forms correctly predicted: {mean:.3f} [{lower:.3f}, {upper:.3f}]")
+
+        #Cross-validate the learned affix accents
+        masks, counts = dybo.learnAffixAccents(nominals, scheme, morphemes)
+        settings = dybo.affixSettings(morphemes)
+        chosen, accuracy = bootstrap.crossValidateAffixes(masks, len(settings), seed = seed)
+
+        for s in sorted(set(chosen)):
+
+            setting = ", ".join([f"{m} = {settings[s][m]}" for m in morphemes])
+            print(f"{scheme}: learned {setting} in {list(chosen).count(s)} folds")
+
+        print(f"{scheme}: held-out nominals with 2/2 correct predictions: {accuracy.mean():.3f}")
+
+    #Compare every pair of schemes on the nominals with 2/2 correct predictions
+    schemeNames = list(scores)
+
+    for i in range(len(schemeNames)):
+
+        for j in range(i + 1, len(schemeNames)):
+
+            a = schemeNames[i]
+            b = schemeNames[j]
+
+            difference, lower, upper, pValue = bootstrap.compareTheories(scores[a] == 2, scores[b] == 2, numResamples, seed = seed, workers = workers)
+            print(f"{a} - {b}: {difference:.3f} [{lower:.3f}, {upper:.3f}], p = {pValue:.4f}")
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+
+import dybo
+
+#The corpus scripts are in the folder next to this one
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Creating the corpus"))
+
+import corpus
+
+#This script goes straight from the plaintext dictionary to the
+#evaluation of Dybo's Rule, in one process: the corpus is built in
+#memory, in the same way as by the scripts in Creating the corpus
+#(see corpus.py), filtered, and evaluated, without writing or reading
+#any corpus files. Use --filter to pick out part of the corpus, e.g.
+#--filter "template=C(V)C(V)C(V)", and --save to also keep a copy of
+#the filtered corpus.
+
+parser = argparse.ArgumentParser(description = "Build the corpus from the dictionary and evaluate Dybo's Rule against it.")
+parser.add_argument("dictionary", nargs = "?", default = "full dictionary.txt", help = "plaintext dictionary")
+parser.add_argument("--filter", default = "", help = "filter expression, e.g. \"template=C(V)C(V)C(V) vowels=*A*\"")
+parser.add_argument("--scheme", choices = list(dybo.schemes), default = "elements", help = "segmentation scheme")
+parser.add_argument("--save", help = "save the filtered corpus to this file")
+parser.add_argument("--align-allomorphs", action = "store_true", help = "evaluate nominals with root allomorphy under an alignment of their roots (see allomorphy.py)")
+args = parser.parse_args()
+
+#Specify the accent of each functional morpheme
+#A = accented, U = unaccented
+dybo.accentStatus["DEF"] = "A"
+dybo.accentStatus["INDF"] = "U"
+
+try:
+
+    nominalCorpus = corpus.buildCorpus(args.dictionary).filter(args.filter)
+
+except ValueError as e:
+
+    parser.error(str(e))
+
+if args.save:
+
+    nominalCorpus.save(args.save)
+
+#Gloss the records, and evaluate them as the other scripts do
+nominals = dybo.nominalsFromRecords(nominalCorpus)
+results, classResults = dybo.evaluateNominals(nominals, args.scheme, alignAllomorphs = args.align_allomorphs)
+
+dybo.printReport(nominals, results, classResults)
@@ -0,0 +1,61 @@
+import argparse
+
+import chains
+import dybo
+
+#This script evaluates Dybo's Rule against forms with any number of
+#morphemes (see chains.py). It takes a file with one form per line:
+#orthography, phonology with hyphens between morphemes, and one gloss
+#per morpheme, e.g.
+#ацәқәа a-Ca-Ca DEF-R-PL
+#The accents of the functional morphemes are those of the other
+#scripts (DEF accented, INDF unaccented), and more can be given with
+#--accent, e.g. --accent PL=A --accent POSS=U. Every gloss without an
+#accent is a stem morpheme, whose elements may be accented or not. For
+#every form, the script prints the elements Dybo's Rule can stress,
+#and whether one of them is stressed in the data.
+
+parser = argparse.ArgumentParser(description = "Evaluate Dybo's Rule against forms with any number of morphemes.")
+parser.add_argument("corpus", help = "file with one form per line: orthography, phonology, glosses")
+parser.add_argument("--scheme", choices = list(dybo.schemes), default = "elements", help = "how to divide stem morphemes into elements")
+parser.add_argument("--accent", action = "append", default = [], help = "accent of a functional morpheme, e.g. PL=A")
+args = parser.parse_args()
+
+#Specify the accent of each functional morpheme
+#A = accented, U = unaccented
+dybo.accentStatus["DEF"] = "A"
+dybo.accentStatus["INDF"] = "U"
+
+for setting in args.accent:
+
+    morpheme, accent = setting.split("=")
+
+    if accent not in ["A", "U"]:
+
+        parser.error(f"the accent of {morpheme} has to be A or U")
+
+    dybo.accentStatus[morpheme] = accent
+
+formsCorrect = 0
+formsTotal = 0
+
+with open(args.corpus, encoding = "utf-8") as f:
+
+    for line in f:
+
+        if not line.strip():
+
+            continue
+
+        orth, phon, gloss = line.split()
+        sites, correct, accents = chains.evaluateChain(phon, gloss, args.scheme)
+
+        formsCorrect += 1 if correct else 0
+        formsTotal += 1
+
+        result = f"correct with {accents}" if correct else "NOT PREDICTED"
+
+        print(f"{orth}: can stress {list(sites)}, {result}")
+
+print(f"Total correct predictions: {formsCorrect}")
+print(f"Total forms predicted: {formsTotal}")
@@ -0,0 +1,24 @@
+import dybo
+
+#This script takes a corpus of Abkhaz nominal forms as input,
+#and asks which accents on the functional morphemes best explain
+#the data under Dybo's Rule. The Evaluating Dybo's Rule scripts
+#assume that the definite prefix is accented and the indefinite
+#suffix is unaccented. Here, we instead try every accentuation of
+#the functional morphemes at once, and count, for each one, the
+#nominals for which some root accentuation predicts both forms
+#correctly. This is done for every segmentation scheme.
+
+#The functional morphemes whose accent we want to learn
+morphemes = ["DEF", "INDF"]
+
+#Load the corpus data, adding morpheme boundaries and glosses
+nominals = dybo.loadNominals("10. C(V)C(V)C(V), UUU.txt")
+
+for scheme in dybo.schemes:
+
+    print(f"Scheme: {scheme}")
+
+    masks, counts = dybo.learnAffixAccents(nominals, scheme, morphemes)
+
+    dybo.printAffixRanking(morphemes, masks, counts)
@@ -0,0 +1,61 @@
+import argparse
+
+import accentSets
+import dybo
+
+#This script takes a corpus of Abkhaz nominal forms as input, and
+#finds, for each nominal, the whole set of root accentuations under
+#which Dybo's Rule predicts both forms correctly (see accentSets.py).
+#For every nominal it prints a pattern summarising the set (A or U
+#where every accentuation in the set agrees, * otherwise) and the
+#number of accentuations in it. It then reports how many roots have
+#a fully determined accent, how many have no consistent accent, and
+#how many aren't constrained at all.
+
+parser = argparse.ArgumentParser(description = "List the consistent root accentuations of every nominal.")
+parser.add_argument("--scheme", choices = list(dybo.schemes), default = "elements", help = "segmentation scheme")
+args = parser.parse_args()
+
+#Load the corpus data, adding morpheme boundaries and glosses
+nominals = dybo.loadNominals("10. C(V)C(V)C(V), UUU.txt")
+
+sets = accentSets.solutionSets(nominals, args.scheme)
+
+determined = 0
+inconsistent = 0
+unconstrained = 0
+nominalsTotal = 0
+
+for i in range(len(nominals)):
+
+    nominal = nominals[i]
+    solutions = sets[i]
+
+    if solutions is None:
+
+        print(f"{nominal[-2]}, {nominal[-1]}: ROOT ALLOMORPHY. NOMINAL NOT EVALUATED.")
+
+        continue
+
+    count = solutions.count()
+
+    print(f"{nominal[-2]}, {nominal[-1]}: {solutions.pattern()} ({count} of {2 ** len(solutions)} accentuations)")
+
+    if count == 0:
+
+        inconsistent += 1
+
+    elif count == 1:
+
+        determined += 1
+
+    elif count == 2 ** len(solutions):
+
+        unconstrained += 1
+
+    nominalsTotal += 1
+
+print(f"Nominals with a fully determined root accent: {determined}")
+print(f"Nominals with no consistent root accent: {inconsistent}")
+print(f"Nominals with an unconstrained root accent: {unconstrained}")
+print(f"Nominals evaluated: {nominalsTotal}")
@@ -0,0 +1,38 @@
+import argparse
+
+import predictions
+
+#This script starts a local service answering requests for Dybo's Rule
+#predictions (see predictions.py). It loads everything once and keeps
+#running, so that other tools can send it batches of forms. By default
+#it serves JSON over HTTP on 127.0.0.1 (nothing is reachable from other
+#machines). With --stdio, it instead reads one JSON batch per line from
+#stdin and writes one JSON list of predictions per line to stdout.
+#Example request batch:
+#[{"definite": "aCCYC"}, {"definite": "ACaC", "indefinite": "CaCyC", "scheme": "syllables"}]
+
+parser = argparse.ArgumentParser(description = "Serve Dybo's Rule stress predictions locally.")
+parser.add_argument("--port", type = int, default = 8642, help = "port to serve HTTP on")
+parser.add_argument("--stdio", action = "store_true", help = "answer batches on stdin/stdout instead of HTTP")
+parser.add_argument("--cache-size", type = int, default = predictions.cacheSize, help = "number of forms to cache")
+args = parser.parse_args()
+
+predictions.setCacheSize(args.cache_size)
+
+if args.stdio:
+
+    predictions.serveStdio()
+
+else:
+
+    server = predictions.makeServer(args.port)
+
+    print(f"Serving predictions on http://127.0.0.1:{server.server_address[1]}/")
+
+    try:
+
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+
+        server.server_close()
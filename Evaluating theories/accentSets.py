@@ -0,0 +1,356 @@
+import dybo
+
+#The Evaluating Dybo's Rule scripts stop at the first root accentuation
+#that accounts for both forms of a nominal, so they don't tell us how
+#constrained a root's accents are. Listing every accentuation that
+#works would take 2^n tuples for a root with n elements. This module
+#instead represents the whole set of accentuations that work as a small
+#automaton, which can be counted, tested and intersected without
+#listing its members.
+#
+#Dybo's Rule can be applied by reading the accents of a form from left
+#to right, keeping track of one of a handful of states: whether we have
+#seen an accent yet, whether the previous element was accented, or (once
+#stress has been assigned) whether it was assigned to the right element.
+#The accents of the functional morphemes are fixed, so only the root
+#accents are free. An AccentSet has one layer of transitions per root
+#element, and a root accentuation (e.g. ("U", "A", "A")) is in the set
+#if reading it from the start state ends in an accepting state.
+
+#The states of the left-to-right reading of Dybo's Rule. A form is
+#correctly predicted if we end up in True, and incorrectly if we end up
+#in False.
+noAccent = "N"
+afterUnaccented = "U"
+afterAccented = "A"
+
+#This function reads the accent of element i of a form, given the
+#state after reading the elements before it, and returns the new state.
+#correct[j] is True if element j is stressed in the data.
+def dyboStep(state, i, accent, correct):
+
+    #Stress has already been assigned
+    if state is True or state is False:
+
+        return state
+
+    #An accent followed by no accent: stress the previous element
+    if state == afterAccented and accent == "U":
+
+        return correct[i - 1]
+
+    if accent == "A":
+
+        return afterAccented
+
+    if state == noAccent:
+
+        return noAccent
+
+    return afterUnaccented
+
+#This function takes the state after reading a whole form and returns
+#True if Dybo's Rule stresses the right element. If there was no
+#accent, stress is root-final, and if no accent was followed by an
+#unaccented element, the final element is stressed.
+def dyboFinal(state, correct, lastRoot):
+
+    if state is True or state is False:
+
+        return state
+
+    if state == noAccent:
+
+        return correct[lastRoot]
+
+    return correct[-1]
+
+class AccentSet:
+
+    #start is the start state, transitions is a list with one dictionary
+    #per root element, mapping each state to a dictionary from accents
+    #("A", "U") to the next state, and accepting is the set of accepting
+    #states after the last root element. States which can't be reached,
+    #or can't lead to an accepting state, are removed, and the states of
+    #every layer are renumbered 0, 1, 2, ...
+    def __init__(self, start, transitions, accepting):
+
+        #Find the states reachable from the start state in every layer
+        reachable = [set([start])]
+
+        for layer in transitions:
+
+            reachable.append(set([layer[s][a] for s in reachable[-1] for a in layer.get(s, {})]))
+
+        #Go backwards to keep only the states that lead to acceptance
+        live = [reachable[-1] & set(accepting)]
+
+        for k in range(len(transitions) - 1, -1, -1):
+
+            live.insert(0, set([s for s in reachable[k] if any(t in live[0] for t in transitions[k].get(s, {}).values())]))
+
+        #Renumber the live states of every layer
+        numbers = [{s: j for j, s in enumerate(sorted(layerStates, key = str))} for layerStates in live]
+
+        self.transitions = []
+
+        for k in range(len(transitions)):
+
+            layer = {}
+
+            for s in live[k]:
+
+                layer[numbers[k][s]] = {a: numbers[k + 1][t] for a, t in transitions[k][s].items() if t in live[k + 1]}
+
+            self.transitions.append(layer)
+
+        self.start = numbers[0].get(start)
+        self.accepting = set(numbers[-1].values())
+
+    #The number of root elements
+    def __len__(self):
+
+        return len(self.transitions)
+
+    #True if no root accentuation is in the set
+    def isEmpty(self):
+
+        return self.start is None
+
+    #Membership test: is this root accentuation (e.g. ("U", "A") or
+    #"UA") in the set?
+    def contains(self, accents):
+
+        if self.isEmpty() or len(accents) != len(self):
+
+            return False
+
+        state = self.start
+
+        for k in range(len(self)):
+
+            state = self.transitions[k][state].get(accents[k])
+
+            if state is None:
+
+                return False
+
+        return state in self.accepting
+
+    def __contains__(self, accents):
+
+        return self.contains(accents)
+
+    #The number of root accentuations in the set, counted layer by
+    #layer without listing them
+    def count(self):
+
+        if self.isEmpty():
+
+            return 0
+
+        counts = {self.start: 1}
+
+        for layer in self.transitions:
+
+            nextCounts = {}
+
+            for s, c in counts.items():
+
+                for t in layer[s].values():
+
+                    nextCounts[t] = nextCounts.get(t, 0) + c
+
+            counts = nextCounts
+
+        return sum([c for s, c in counts.items() if s in self.accepting])
+
+    #The root accentuations in both sets (of the same length)
+    def intersect(self, other):
+
+        if self.isEmpty() or other.isEmpty():
+
+            return emptySet(len(self))
+
+        transitions = []
+
+        for k in range(len(self)):
+
+            layer = {}
+
+            for s in self.transitions[k]:
+
+                for t in other.transitions[k]:
+
+                    layer[(s, t)] = {a: (self.transitions[k][s][a], other.transitions[k][t][a]) for a in self.transitions[k][s] if a in other.transitions[k][t]}
+
+            transitions.append(layer)
+
+        accepting = set([(s, t) for s in self.accepting for t in other.accepting])
+
+        return AccentSet((self.start, other.start), transitions, accepting)
+
+    #A summary of the set as a pattern over A, U and *, e.g. "A*U": the
+    #accent of each root element if every accentuation in the set agrees
+    #on it, or * if both accents occur. The set can be smaller than the
+    #pattern (see isPattern).
+    def pattern(self):
+
+        if self.isEmpty():
+
+            return None
+
+        pattern = ""
+        states = set([self.start])
+
+        for layer in self.transitions:
+
+            accents = set([a for s in states for a in layer[s]])
+            pattern += accents.pop() if len(accents) == 1 else "*"
+            states = set([layer[s][a] for s in states for a in layer[s]])
+
+        return pattern
+
+    #True if the set is exactly its pattern, i.e. the accents of the
+    #root elements are independent of each other
+    def isPattern(self):
+
+        return not self.isEmpty() and self.count() == 2 ** self.pattern().count("*")
+
+    #True if exactly one root accentuation is in the set
+    def isDetermined(self):
+
+        return self.count() == 1
+
+    #One root accentuation in the set (the first in the order of
+    #itertools.product(["U", "A"], ...)), or None if the set is empty
+    def witness(self):
+
+        if self.isEmpty():
+
+            return None
+
+        accents = []
+        state = self.start
+
+        for layer in self.transitions:
+
+            a = "U" if "U" in layer[state] else "A"
+            accents.append(a)
+            state = layer[state][a]
+
+        return tuple(accents)
+
+    def __repr__(self):
+
+        return f"AccentSet({self.pattern()}, {self.count()} accentuations)"
+
+#The empty set of root accentuations with numRootElements elements
+def emptySet(numRootElements):
+
+    return AccentSet(0, [{} for k in range(numRootElements)], set())
+
+#The set of all root accentuations with numRootElements elements
+def fullSet(numRootElements):
+
+    return AccentSet(0, [{0: {"U": 0, "A": 0}} for k in range(numRootElements)], set([0]))
+
+#The set containing only the unaccented root
+def unaccentedSet(numRootElements):
+
+    return AccentSet(0, [{0: {"U": 0}} for k in range(numRootElements)], set([0]))
+
+#This function takes a parsed nominal (see dybo.parseNominal), the index
+#of one of its forms (0 or 2), the number of root elements, the function
+#checking whether an element is stressed and a dictionary with the
+#accents of the functional morphemes, and returns the set of root
+#accentuations under which Dybo's Rule predicts that form correctly.
+def formSet(n, i, numRootElements, isStressed, status = dybo.accentStatus):
+
+    phonList = n[i].split("-")
+    glossList = n[i + 1].split("-")
+    correct = [isStressed(p) for p in phonList]
+    lastRoot = max([j for j in range(len(glossList)) if glossList[j].startswith("R")])
+
+    #Where each root element is in the form
+    rootPositions = {}
+
+    for j in range(len(glossList)):
+
+        if glossList[j].startswith("R"):
+
+            rootPositions[int(glossList[j][1:])] = j
+
+    #This function reads the functional morphemes from position j up
+    #to the next root element (or the end of the form)
+    def readFixed(state, j):
+
+        while j < len(glossList) and not glossList[j].startswith("R"):
+
+            state = dyboStep(state, j, status[glossList[j]], correct)
+            j += 1
+
+        return state
+
+    states = [noAccent, afterUnaccented, afterAccented, True, False]
+    start = readFixed(noAccent, 0)
+    transitions = []
+
+    for k in range(numRootElements):
+
+        layer = {}
+
+        for s in states:
+
+            #A root element that isn't in this form doesn't change anything
+            if k not in rootPositions:
+
+                layer[s] = {"U": s, "A": s}
+
+                continue
+
+            layer[s] = {a: readFixed(dyboStep(s, rootPositions[k], a, correct), rootPositions[k] + 1) for a in ["U", "A"]}
+
+        transitions.append(layer)
+
+    accepting = set([s for s in states if dyboFinal(s, correct, lastRoot)])
+
+    return AccentSet(start, transitions, accepting)
+
+#This function returns the set of root accentuations of a glossed
+#nominal under which Dybo's Rule predicts both forms correctly, under
+#one of the schemes in dybo.py. It returns None if the nominal has root
+#allomorphy.
+def solutionSet(n, scheme, status = dybo.accentStatus):
+
+    isStressed, unaccentedOnly = dybo.schemes[scheme][1:]
+
+    if dybo.hasRootAllomorphy(n):
+
+        return None
+
+    nominal, numRootElements = dybo.parseNominal(n, scheme)
+
+    solutions = formSet(nominal, 0, numRootElements, isStressed, status).intersect(formSet(nominal, 2, numRootElements, isStressed, status))
+
+    if unaccentedOnly and unaccentedOnly(nominal):
+
+        solutions = solutions.intersect(unaccentedSet(numRootElements))
+
+    return solutions
+
+#This function returns the solution set of every nominal in a list,
+#computing it once per phonological class
+def solutionSets(nominals, scheme):
+
+    sets = [None] * len(nominals)
+
+    for key, members in dybo.groupNominals(nominals).items():
+
+        solutions = solutionSet(nominals[members[0]], scheme)
+
+        for i in members:
+
+            sets[i] = solutions
+
+    return sets
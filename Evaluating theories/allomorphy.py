@@ -0,0 +1,260 @@
+from functools import lru_cache
+from itertools import product
+
+import dybo
+
+#When the root of the definite and the root of the indefinite differ
+#(other than in schwa), the Evaluating Dybo's Rule scripts can't tell
+#which element of one form corresponds to which element of the other,
+#so they leave the nominal out. This module aligns the two roots
+#segment by segment, with the alignment of smallest edit distance,
+#names the alternations it finds (e.g. a final vowel in the indefinite
+#only), and evaluates the nominal under the alignment: an element of
+#either form gets the accent of the root segment it starts with, so
+#elements starting with the same segment share their accent.
+#Alignments are cached by the pair of roots, since the same
+#alternation comes up again and again.
+
+#The cost of leaving a segment unaligned, and of aligning two different
+#segments. A schwa is cheaper to leave out than anything else, and a
+#vowel is never aligned with a consonant (it's cheaper to leave both
+#out).
+def gapCost(s):
+
+    return 1 if s == "y" else 2
+
+def substitutionCost(s, t):
+
+    if s == t:
+
+        return 0
+
+    if s != "c" and t != "c":
+
+        return 2
+
+    return 5
+
+#This function aligns two roots (in lowercase, e.g. "cacyc" and
+#"cacyca"), and returns a tuple of aligned pairs of segments, with ""
+#for a segment only found in one of them, e.g. (("c", "c"), ("a", "a"),
+#("c", "c"), ("y", "y"), ("c", "c"), ("", "a")). Where several
+#alignments are equally good, we prefer aligning segments, and then
+#leaving out segments of the definite.
+@lru_cache(maxsize = None)
+def alignRoots(defRoot, indfRoot):
+
+    m = len(defRoot)
+    n = len(indfRoot)
+
+    #costs[i][j]: the cost of aligning the first i segments of the
+    #definite root with the first j segments of the indefinite root
+    costs = [[0] * (n + 1) for i in range(m + 1)]
+
+    for i in range(1, m + 1):
+
+        costs[i][0] = costs[i - 1][0] + gapCost(defRoot[i - 1])
+
+    for j in range(1, n + 1):
+
+        costs[0][j] = costs[0][j - 1] + gapCost(indfRoot[j - 1])
+
+    for i in range(1, m + 1):
+
+        for j in range(1, n + 1):
+
+            costs[i][j] = min(costs[i - 1][j - 1] + substitutionCost(defRoot[i - 1], indfRoot[j - 1]), costs[i - 1][j] + gapCost(defRoot[i - 1]), costs[i][j - 1] + gapCost(indfRoot[j - 1]))
+
+    #Go back through the table to recover the alignment
+    alignment = []
+    i = m
+    j = n
+
+    while i > 0 or j > 0:
+
+        if i > 0 and j > 0 and costs[i][j] == costs[i - 1][j - 1] + substitutionCost(defRoot[i - 1], indfRoot[j - 1]):
+
+            alignment.append((defRoot[i - 1], indfRoot[j - 1]))
+            i -= 1
+            j -= 1
+
+        elif i > 0 and costs[i][j] == costs[i - 1][j] + gapCost(defRoot[i - 1]):
+
+            alignment.append((defRoot[i - 1], ""))
+            i -= 1
+
+        else:
+
+            alignment.append(("", indfRoot[j - 1]))
+            j -= 1
+
+    return tuple(reversed(alignment))
+
+#This function takes a glossed nominal and returns the alignment of
+#its roots, with consonants as c and vowels in lowercase (stress is
+#left out)
+def nominalAlignment(n):
+
+    return alignRoots(n[0].split("-")[1].lower(), n[2].split("-")[0].lower())
+
+#This function names the alternations in an alignment, returning a
+#tuple of labels such as ("schwa deletion", "final vowel insertion"),
+#where insertion and deletion are from the definite to the indefinite
+def classifyAlignment(alignment):
+
+    labels = []
+
+    for k in range(len(alignment)):
+
+        s, t = alignment[k]
+
+        if s == t:
+
+            continue
+
+        if s and t:
+
+            labels.append("vowel quality change")
+
+            continue
+
+        segment = s or t
+        change = "deletion" if s else "insertion"
+
+        #The neighbouring segments of the other form
+        before = alignment[k - 1] if k > 0 else ("", "")
+        after = alignment[k + 1] if k + 1 < len(alignment) else ("", "")
+
+        if segment == "y":
+
+            labels.append(f"schwa {change}")
+
+        elif segment == "c":
+
+            labels.append(f"consonant {change}")
+
+        elif segment in [before[0] if t else before[1], after[0] if t else after[1]]:
+
+            labels.append("vowel shortening" if s else "vowel lengthening")
+
+        elif k == len(alignment) - 1:
+
+            labels.append(f"final vowel {change}")
+
+        elif k == 0:
+
+            labels.append(f"initial vowel {change}")
+
+        else:
+
+            labels.append(f"vowel {change}")
+
+    return tuple(labels)
+
+#This function takes a glossed nominal with root allomorphy and a
+#scheme, and returns a parsed copy of it, where the root elements of
+#both forms are numbered by the segment of the aligned roots they start
+#with, together with the number of such segments: the root elements of
+#the two forms which start with the same segment have the same number,
+#and so the same accent.
+def alignNominal(n, scheme):
+
+    nominal, numRootElements = dybo.parseNominal(n, scheme)
+    alignment = nominalAlignment(n)
+
+    #columns[f][k]: the position in the alignment of segment k of the
+    #root of form f (0 for the definite, 1 for the indefinite)
+    columns = [[c for c in range(len(alignment)) if alignment[c][f]] for f in [0, 1]]
+
+    #The alignment position where every root element starts
+    starts = {}
+
+    for f, i in [[0, 0], [1, 2]]:
+
+        phonList = nominal[i].split("-")
+        glossList = nominal[i + 1].split("-")
+        segment = 0
+
+        for j in range(len(glossList)):
+
+            if glossList[j].startswith("R"):
+
+                starts[(f, j)] = columns[f][segment]
+
+                #Every scheme keeps one character per segment, so an
+                #element covers as many segments as it has characters
+                segment += len(phonList[j])
+
+    anchors = sorted(set(starts.values()))
+
+    for f, i in [[0, 0], [1, 2]]:
+
+        glossList = nominal[i + 1].split("-")
+
+        for j in range(len(glossList)):
+
+            if (f, j) in starts:
+
+                glossList[j] = f"R{anchors.index(starts[(f, j)])}"
+
+        nominal[i + 1] = "-".join(glossList)
+
+    return [nominal, len(anchors)]
+
+#This function does the same as dybo.searchAccents for a nominal with
+#root allomorphy, with the roots aligned as in alignNominal. It returns
+#the best score and the accentuation of the aligned root that led to
+#it, e.g. [[1, 1], ("U", "A")].
+def searchAlignedAccents(n, scheme):
+
+    isStressed, unaccentedOnly = dybo.schemes[scheme][1:]
+    nominal, numRootElements = alignNominal(n, scheme)
+
+    tempHighscore = [0, 0]
+    tempHighAccents = tuple(["U"] * numRootElements)
+
+    for rootAccent in product(["U", "A"], repeat = numRootElements):
+
+        if unaccentedOnly and unaccentedOnly(nominal) and "A" in rootAccent:
+
+            continue
+
+        tempScore = dybo.evaluateDybo(nominal, rootAccent, isStressed)
+
+        if tempScore.count(1) > tempHighscore.count(1):
+
+            tempHighscore = tempScore
+            tempHighAccents = rootAccent
+
+        if tempHighscore.count(1) == 2:
+
+            break
+
+    return [tempHighscore, tempHighAccents]
+
+#This function prints every nominal with root allomorphy with the
+#alignment of its roots and the alternations in it, followed by how
+#many nominals have each alternation
+def printAlternations(nominals):
+
+    counts = {}
+
+    for n in nominals:
+
+        if not dybo.hasRootAllomorphy(n):
+
+            continue
+
+        alignment = nominalAlignment(n)
+        labels = classifyAlignment(alignment)
+        aligned = " ".join([f"{s or '-'}:{t or '-'}" for s, t in alignment])
+
+        print(f"{n[-2]}, {n[-1]}: {aligned} ({', '.join(labels)})")
+
+        for label in set(labels):
+
+            counts[label] = counts.get(label, 0) + 1
+
+    for label, count in sorted(counts.items(), key = lambda c: -c[1]):
+
+        print(f"{label}: {count} nominals")
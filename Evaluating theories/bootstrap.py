@@ -0,0 +1,155 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+#This module puts uncertainty estimates on the totals reported by the
+#Evaluating Dybo's Rule scripts. It works on per-nominal score vectors
+#(e.g. the number of forms correctly predicted for each nominal), so it
+#can be used with any evaluator. It provides bootstrap confidence
+#intervals, paired comparisons of two theories evaluated on the same
+#nominals, and k-fold cross-validation of learned affix accents.
+#Resampling is vectorised with numpy: each batch of resamples is drawn
+#as one matrix, rather than one resample at a time.
+
+#The largest number of cells in an index matrix drawn at once
+#(rows = resamples, columns = nominals). This bounds memory use.
+maxCells = 2 ** 24
+
+#The largest number of distinct score rows for which we resample
+#counts instead of indices (see resampleMeans)
+maxDistinct = 4096
+
+#This function takes the per-nominal results of dybo.evaluateNominals
+#(or anything in the same format) and returns a numpy array with the
+#number of correctly predicted forms (0, 1 or 2) for every evaluated
+#nominal. Nominals that weren't evaluated (None) are left out.
+def scoresFromResults(results):
+
+    return np.array([r[0].count(1) for r in results if r is not None])
+
+#This function draws numResamples bootstrap resamples of the rows of
+#data (a 2D array, one row per nominal) and returns a matrix with the
+#mean of every column in every resample (numResamples x columns).
+#Scores usually only take a handful of values (0, 1, 2), and a
+#resample's mean only depends on how many times each distinct row is
+#drawn. If there are few distinct rows, we therefore draw those counts
+#from a multinomial distribution, which gives exactly the same
+#distribution as drawing indices, at a cost that doesn't depend on the
+#number of nominals. Otherwise we draw index matrices in batches.
+def resampleMeans(data, numResamples, seed):
+
+    rng = np.random.default_rng(seed)
+    n = len(data)
+
+    rows, counts = np.unique(data, axis = 0, return_counts = True)
+
+    if len(rows) <= maxDistinct:
+
+        draws = rng.multinomial(n, counts / n, size = numResamples)
+
+        return draws @ rows / n
+
+    means = np.empty((numResamples, data.shape[1]))
+    batch = max(1, maxCells // n)
+
+    for start in range(0, numResamples, batch):
+
+        stop = min(start + batch, numResamples)
+        indices = rng.integers(0, n, size = (stop - start, n))
+        means[start:stop] = data[indices].mean(axis = 1)
+
+    return means
+
+#This function runs resampleMeans, optionally splitting the resamples
+#across several worker processes. Each worker gets its own independent
+#random stream spawned from seed, so results are reproducible for a
+#given seed and number of workers.
+def bootstrapMeans(data, numResamples = 10000, seed = None, workers = 1):
+
+    data = np.asarray(data, dtype = float)
+
+    if data.ndim == 1:
+
+        data = data[:, None]
+
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+
+    if workers == 1:
+
+        return resampleMeans(data, numResamples, seeds[0])
+
+    #Split the resamples as evenly as possible between the workers
+    sizes = [numResamples // workers + (1 if w < numResamples % workers else 0) for w in range(workers)]
+
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+
+        parts = list(executor.map(resampleMeans, [data] * workers, sizes, seeds))
+
+    return np.concatenate(parts)
+
+#This function returns the mean of scores together with a percentile
+#bootstrap confidence interval: [mean, lower, upper]
+def confidenceInterval(scores, numResamples = 10000, confidence = 0.95, seed = None, workers = 1):
+
+    scores = np.asarray(scores, dtype = float)
+    means = bootstrapMeans(scores, numResamples, seed, workers)[:, 0]
+    alpha = 1 - confidence
+
+    lower, upper = np.quantile(means, [alpha / 2, 1 - alpha / 2])
+
+    return [float(scores.mean()), float(lower), float(upper)]
+
+#This function compares two theories evaluated on the same nominals
+#(scoresA[i] and scoresB[i] are scores for the same nominal). Nominals
+#are resampled in pairs, so the comparison takes into account that some
+#nominals are hard for every theory. It returns the mean difference
+#(A - B), a confidence interval for it, and a two-sided bootstrap
+#p-value for the hypothesis that there is no difference:
+#[difference, lower, upper, pValue]
+def compareTheories(scoresA, scoresB, numResamples = 10000, confidence = 0.95, seed = None, workers = 1):
+
+    pairs = np.column_stack([scoresA, scoresB]).astype(float)
+    means = bootstrapMeans(pairs, numResamples, seed, workers)
+    differences = means[:, 0] - means[:, 1]
+    alpha = 1 - confidence
+
+    lower, upper = np.quantile(differences, [alpha / 2, 1 - alpha / 2])
+    pValue = min(1.0, 2 * min((differences <= 0).mean(), (differences >= 0).mean()))
+
+    return [float(pairs[:, 0].mean() - pairs[:, 1].mean()), float(lower), float(upper), float(pValue)]
+
+#This function cross-validates the affix accents learned by
+#dybo.learnAffixAccents. It takes the per-nominal masks it returns and
+#the number of affix settings, splits the nominals into k folds, picks
+#the setting fitting the most nominals in the other k - 1 folds, and
+#checks how many nominals in the held-out fold that setting fits. It
+#returns the setting chosen for every fold and the held-out proportion
+#of nominals with 2/2 correct predictions for every fold. With fewer
+#evaluated nominals than k, there is one fold per nominal.
+def crossValidateAffixes(masks, numSettings, k = 10, seed = None):
+
+    rng = np.random.default_rng(seed)
+
+    #One row per evaluated nominal, one column per setting:
+    #1 if the setting fits the nominal, 0 otherwise
+    fits = np.array([[(m >> s) & 1 for s in range(numSettings)] for m in masks if m is not None], dtype = int).reshape(-1, numSettings)
+
+    if len(fits) == 0:
+
+        raise ValueError("there are no evaluated nominals to cross-validate on")
+
+    #No fold can be empty
+    k = min(k, len(fits))
+
+    #Assign every nominal to a fold at random, with fold sizes
+    #differing by at most one
+    folds = rng.permutation(len(fits)) % k
+
+    #Count the fitted nominals per fold and setting
+    foldCounts = np.zeros((k, numSettings))
+    np.add.at(foldCounts, folds, fits)
+
+    #Train on everything but the fold, then test on the fold
+    chosen = (foldCounts.sum(axis = 0) - foldCounts).argmax(axis = 1)
+    accuracy = foldCounts[np.arange(k), chosen] / np.bincount(folds, minlength = k)
+
+    return [chosen, accuracy]
@@ -0,0 +1,194 @@
+import dybo
+
+#The Evaluating Dybo's Rule scripts look at nominals with exactly two
+#morphemes per form (DEF-R and R-INDF), and search through every
+#accentuation of the root. This module handles forms made up of any
+#chain of morphemes: any number of prefixes and suffixes, whose accents
+#are given in a table (like dybo.accentStatus), and one or more stem
+#morphemes (any gloss not in the table), whose elements can be accented
+#or not. Instead of trying all 2^n accentuations of the stem elements,
+#it works out every element Dybo's Rule can stress, with an
+#accentuation that does it, in one pass over the elements. Each of these
+#accentuations is kept as a span of accented elements, and only written
+#out in full when asked for (see witnessAccents), so the whole
+#evaluation takes time linear in the number of elements.
+#
+#Dybo's Rule stresses element j if j is accented, j + 1 is unaccented,
+#and no accent before j is followed by an unaccented element. The
+#elements before j must therefore be some unaccented elements followed
+#by some accented ones (U...UA...A). Going from left to right, we keep
+#track of where the accented block can start at the latest, which tells
+#us which j can be stressed. The final element can be stressed if the
+#whole form is U...UA...A with at least one accent, and the last stem
+#element is stressed if there is no accent at all. Elements which have
+#to be unaccented (see unaccentedElements) simply can't start the
+#accented block.
+
+#This function takes a form as a phonological string and a gloss string
+#with one gloss per morpheme (e.g. "a-CaCa-Ca-C", "POSS-R-PL-INDF"), a
+#scheme (see dybo.schemes) and a dictionary with the accents of the
+#functional morphemes. It divides every stem morpheme (every gloss not
+#in status) into elements under the scheme, and returns the
+#phonological and gloss lists, e.g. [[a, Ca, Ca, Ca, C], [POSS, R0,
+#R1, PL, INDF]]. Stem morphemes must have different glosses. The parse
+#functions only look at the morpheme they divide, so every stem
+#morpheme is parsed on its own, in one pass over the chain.
+def segmentChain(phonString, glossString, scheme, status = dybo.accentStatus):
+
+    parse = dybo.schemes[scheme][0]
+    phonList = []
+    glossList = []
+
+    for p, m in zip(phonString.split("-"), glossString.split("-")):
+
+        if m in status:
+
+            phonList.append(p)
+            glossList.append(m)
+
+        else:
+
+            phonElements, glossElements = parse(p, m, m)
+            phonList.extend(phonElements.split("-"))
+            glossList.extend(glossElements.split("-"))
+
+    return [phonList, glossList]
+
+#This function takes a form as in segmentChain, the same form as
+#segmented by it, a scheme and a dictionary with the accents of the
+#functional morphemes, and returns the set of stem elements which have
+#to be unaccented. As in dybo.searchAccents, a scheme can require a
+#root to be unaccented (dybo.schemes[scheme][2], e.g. a root without
+#underlying syllables under the syllables scheme); here, every stem
+#morpheme is checked as if it were the root of a nominal.
+def unaccentedElements(phonString, glossString, glossList, scheme, status = dybo.accentStatus):
+
+    unaccentedOnly = dybo.schemes[scheme][2]
+    unaccented = set()
+
+    if not unaccentedOnly:
+
+        return unaccented
+
+    k = 0
+
+    for p, m in zip(phonString.split("-"), glossString.split("-")):
+
+        if m in status:
+
+            k += 1
+
+            continue
+
+        #The stem morpheme as the root of the definite of a nominal
+        fixed = unaccentedOnly([f"-{p}"])
+        i = 0
+
+        #The elements of m are glossed m0, m1, ...
+        while k < len(glossList) and glossList[k] == f"{m}{i}":
+
+            if fixed:
+
+                unaccented.add(k)
+
+            k += 1
+            i += 1
+
+    return unaccented
+
+#This function takes the gloss list of a segmented form, a dictionary
+#with the accents of the functional morphemes, and optionally a set of
+#stem elements which have to be unaccented, and returns a dictionary
+#from every element Dybo's Rule can stress (in order) to an
+#accentuation of the stem elements under which it is stressed. Of all
+#the accentuations stressing an element, it picks the first in the order
+#of itertools.product(["U", "A"], ...). That accentuation always has the
+#stem elements from some s up to some stop accented, and the rest
+#unaccented, so it is given as the span (s, stop); witnessAccents writes
+#it out. It takes time linear in the number of elements.
+def stressSites(glossList, status = dybo.accentStatus, unaccented = frozenset()):
+
+    n = len(glossList)
+    free = [g not in status for g in glossList]
+    canU = [free[k] or status[glossList[k]] == "U" for k in range(n)]
+    canA = [(free[k] and k not in unaccented) or (not free[k] and status[glossList[k]] == "A") for k in range(n)]
+
+    #allU[k]: can the first k elements all be unaccented?
+    allU = [True]
+
+    for k in range(n):
+
+        allU.append(allU[k] and canU[k])
+
+    #blockStart[k]: the latest s such that the first k elements can be
+    #U...U (elements before s) A...A (elements s to k - 1), or None.
+    #The latest start puts as many unaccented elements first as possible.
+    blockStart = [0]
+
+    for k in range(1, n + 1):
+
+        if allU[k]:
+
+            blockStart.append(k)
+
+        elif blockStart[k - 1] is not None and canA[k - 1]:
+
+            blockStart.append(blockStart[k - 1])
+
+        else:
+
+            blockStart.append(None)
+
+    #spans[j]: the span of accented elements stressing element j, if
+    #there is one
+    spans = [None] * n
+
+    #No accent at all: stress is stem-final
+    if allU[n] and True in free:
+
+        spans[max([k for k in range(n) if free[k]])] = (n, n)
+
+    #An accent followed by an unaccented element (which is outside the
+    #span, so it stays unaccented)
+    for j in range(n - 1):
+
+        if spans[j] is None and blockStart[j] is not None and canA[j] and canU[j + 1]:
+
+            spans[j] = (blockStart[j], j + 1)
+
+    #Only accents after the unaccented elements: stress is final
+    if n and spans[n - 1] is None and canA[n - 1] and blockStart[n - 1] is not None:
+
+        spans[n - 1] = (blockStart[n - 1], n)
+
+    return {j: spans[j] for j in range(n) if spans[j] is not None}
+
+#This function takes the gloss list of a segmented form, a dictionary
+#with the accents of the functional morphemes and a span from
+#stressSites, and returns the accentuation of the stem elements it
+#stands for, as a tuple with one accent per stem element, in order
+def witnessAccents(glossList, span, status = dybo.accentStatus):
+
+    s, stop = span
+
+    return tuple(["A" if s <= k < stop else "U" for k in range(len(glossList)) if glossList[k] not in status])
+
+#This function evaluates Dybo's Rule against a single form, given as in
+#segmentChain. It returns [sites, correct, accents]: the elements Dybo's
+#Rule can stress (with spans, as in stressSites), whether one of them is
+#stressed in the data, and the accentuation of the stem elements
+#stressing it (or None).
+def evaluateChain(phonString, glossString, scheme, status = dybo.accentStatus):
+
+    isStressed = dybo.schemes[scheme][1]
+    phonList, glossList = segmentChain(phonString, glossString, scheme, status)
+    unaccented = unaccentedElements(phonString, glossString, glossList, scheme, status)
+    sites = stressSites(glossList, status, unaccented)
+
+    for j, span in sites.items():
+
+        if isStressed(phonList[j]):
+
+            return [sites, True, witnessAccents(glossList, span, status)]
+
+    return [sites, False, None]
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+
+#This module saves and loads checkpoints for long evaluation runs
+#(see dybo.evaluateNominals), so that a run which is killed can be
+#resumed without redoing the work already done. The classes of
+#nominals are evaluated in shards, and a checkpoint records which
+#shards are done, the running totals, and the result for every
+#class evaluated so far. Checkpoints are written atomically: we write
+#to a temporary file and then rename it over the old checkpoint, so
+#a run killed while saving still leaves the previous checkpoint intact.
+
+#This function returns a fingerprint of the classes being evaluated,
+#so we don't resume from a checkpoint made with another corpus
+def corpusFingerprint(classes):
+
+    h = hashlib.sha1()
+
+    for key, members in classes.items():
+
+        h.update(f"{key[0]} {key[1]} {len(members)}\n".encode("utf-8"))
+
+    return h.hexdigest()
+
+#This function adds up the running totals from the class results,
+#in the same way as dybo.printReport
+def aggregateResults(classResults):
+
+    aggregates = {"totalCorrect": 0, "totalTotal": 0, "nominalsCorrect": 0, "nominalsTotal": 0}
+
+    for result, size in classResults.values():
+
+        if result is None:
+
+            continue
+
+        aggregates["totalCorrect"] += result[0].count(1) * size
+        aggregates["totalTotal"] += 2 * size
+        aggregates["nominalsCorrect"] += size if result[0].count(1) == 2 else 0
+        aggregates["nominalsTotal"] += size
+
+    return aggregates
+
+#This function atomically saves a checkpoint, made with the accents of
+#the functional morphemes in status
+def saveCheckpoint(fileName, scheme, fingerprint, status, shardSize, completedShards, classResults):
+
+    checkpoint = {}
+    checkpoint["scheme"] = scheme
+    checkpoint["corpus"] = fingerprint
+    checkpoint["accentStatus"] = dict(status)
+    checkpoint["shardSize"] = shardSize
+    checkpoint["completedShards"] = sorted(completedShards)
+    checkpoint["aggregates"] = aggregateResults(classResults)
+
+    #Class keys are pairs of strings, which JSON can't use as keys,
+    #so we store the classes as a list
+    checkpoint["classResults"] = [[key[0], key[1], result, size] for key, [result, size] in classResults.items()]
+
+    tempFileName = fileName + ".tmp"
+
+    with open(tempFileName, mode = "w", encoding = "utf-8") as f:
+
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tempFileName, fileName)
+
+#This function loads a checkpoint, checking that it was made for the
+#same scheme, corpus, accents of the functional morphemes and shard
+#size. It returns the set of completed shards and the class results.
+def loadCheckpoint(fileName, scheme, fingerprint, status, shardSize):
+
+    with open(fileName, encoding = "utf-8") as f:
+
+        checkpoint = json.load(f)
+
+    if [checkpoint["scheme"], checkpoint["corpus"], checkpoint.get("accentStatus"), checkpoint["shardSize"]] != [scheme, fingerprint, dict(status), shardSize]:
+
+        raise ValueError(f"{fileName} is a checkpoint for a different scheme, corpus, accents of the functional morphemes or shard size")
+
+    classResults = {}
+
+    for defPhon, indfPhon, result, size in checkpoint["classResults"]:
+
+        #Accents are stored as lists, but are tuples everywhere else
+        if result is not None:
+
+            result = [result[0], tuple(result[1])]
+
+        classResults[(defPhon, indfPhon)] = [result, size]
+
+    return [set(checkpoint["completedShards"]), classResults]
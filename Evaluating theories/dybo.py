@@ -0,0 +1,782 @@
+import argparse
+import os
+import time
+from itertools import product
+
+import allomorphy
+import checkpoints
+import resultStore
+import sharedCorpus
+
+#This module contains the code shared by the Evaluating Dybo's Rule
+#scripts. Each script picks a segmentation scheme (elements, syllables
+#or whole morphemes), and this module takes care of loading the corpus,
+#glossing each nominal, searching through root accentuations, and
+#reporting the results.
+#Many nominals share the same phonological transcription (e.g. every
+#word of the shape aCA CAC), and the evaluation only ever looks at the
+#phonology. We therefore group nominals into classes by their definite
+#and indefinite phonology, search once per class, and copy the result
+#to every word in the class.
+
+accentStatus = {}
+
+#Specify the accent of each functional morpheme
+#A = accented, U = unaccented
+accentStatus["DEF"] = "A"
+accentStatus["INDF"] = "U"
+
+#This function takes a phonological string (e.g. A-CaaCa-Ca)
+#and a corresponding gloss string (e.g. DEF-R-INF), and a
+#morpheme that appears in the gloss (e.g. R), and returns
+#a phonological string and gloss string where the morpheme
+#m has been divided into elements: [A-Caa-Ca-Ca, DEF-R0-R1-INF]
+#I closely follow Spruit (1986), who claims that there is
+#one accent per element. An element is a sequence CV(V), or
+#a C (if not immediately followed by a vowel), or a V (if not
+#immediately preceded by a consonant).
+def parseElements(phonString, glossString, m):
+
+    #Get the phonological shape of m (e.g. CaaCa)
+    phonList = phonString.split("-")
+    glossList = glossString.split("-")
+    phonMorpheme = phonList[glossList.index(m)]
+
+    #Remove information about vowel quality (irrelevant)
+    phonMorpheme = phonMorpheme.replace("A", "V")
+    phonMorpheme = phonMorpheme.replace("Y", "V")
+    phonMorpheme = phonMorpheme.replace("a", "v")
+    phonMorpheme = phonMorpheme.replace("y", "v")
+
+    #Add hyphens corresponding to element boundaries
+
+    #Postvocalic boundary
+    phonMorpheme = phonMorpheme.replace("V", "V-")
+    phonMorpheme = phonMorpheme.replace("v", "v-")
+
+    #Add boundaries in consonant clusters
+    while "CC" in phonMorpheme:
+
+        phonMorpheme = phonMorpheme.replace("CC", "C-C")
+
+    #Remove redundant boundaries
+    while "--" in phonMorpheme:
+
+        phonMorpheme = phonMorpheme.replace("--", "-")
+
+    #Treat vv as a single element (following Spruit 1986)
+    #*Stressed* long vowels don't occur in the corpus,
+    #so we can limit ourselves to lowercase v here
+    phonMorpheme = phonMorpheme.replace("v-v", "vv")
+
+    #Get rid of element boundary after final vowel
+    if phonMorpheme.endswith("v-") or phonMorpheme.endswith("V-"):
+
+        phonMorpheme = phonMorpheme[:-1]
+
+    return replaceMorpheme(phonList, glossList, m, phonMorpheme)
+
+#This function does the same as parseElements, but divides the
+#morpheme m into syllables instead: [A-Caa-Ca-Ca, DEF-R0-R1-INF]
+#We assume one accent per underlying vowel. Note that
+#syllabification entirely ignores the non-underlying vowel schwa
+def parseSyllables(phonString, glossString, m):
+
+    #Get the phonological shape of m (e.g. CaaCa)
+    phonList = phonString.split("-")
+    glossList = glossString.split("-")
+    phonMorpheme = phonList[glossList.index(m)]
+
+    #Add hyphens corresponding to syllable boundaries
+
+    #Pre-/a/ boundary
+    phonMorpheme = phonMorpheme.replace("A", "-A")
+    phonMorpheme = phonMorpheme.replace("a", "-a")
+
+    #Treat aa as a single unit (following Spruit 1986)
+    #*Stressed* long vowels don't occur in the corpus,
+    #so we can limit ourselves to lowercase a here
+    phonMorpheme = phonMorpheme.replace("a-a", "aa")
+
+    #We want CCaCa to be syllabified CCaC-a, and not
+    #CC-aC-a, and this fixes that. Note that this
+    #syllabification is coda-maximizing with no
+    #consequences. It could easily be rewritten to
+    #be onset-maximizing, but it has no impact
+    if "-" in phonMorpheme and "a" in phonMorpheme.lower():
+
+        #If there's a syllable boundary before the first vowel
+        if phonMorpheme.index("-") < phonMorpheme.lower().index("a"):
+
+            #Remove that syllable boundary
+            phonMorpheme = phonMorpheme.replace("-", "", 1)
+
+    return replaceMorpheme(phonList, glossList, m, phonMorpheme)
+
+#This function leaves the morpheme m undivided, treating the
+#whole morpheme as carrying a single accent: [A-CaaCaCa, DEF-R0-INF]
+def parseMorphemes(phonString, glossString, m):
+
+    phonList = phonString.split("-")
+    glossList = glossString.split("-")
+
+    return replaceMorpheme(phonList, glossList, m, phonList[glossList.index(m)])
+
+#A helper function for the parse functions above. It takes in the
+#phonological and gloss lists of a form, a morpheme m, and the new
+#hyphenated shape of m (e.g. Caa-Ca-Ca), and returns the phonological
+#string and gloss string with m replaced: [A-Caa-Ca-Ca, DEF-R0-R1-R2-INF]
+def replaceMorpheme(phonList, glossList, m, phonMorpheme):
+
+    #Update phonList with the newly parsed form
+    phonList[glossList.index(m)] = phonMorpheme
+
+    #Add corresponding hyphens to the gloss
+    newMorphemeGloss = ""
+
+    #The number of elements is the number of hyphens
+    #in phonMorpheme plus one
+    for i in range(phonMorpheme.count("-") + 1):
+
+        newMorphemeGloss += m + str(i) + "-"
+
+    if newMorphemeGloss.endswith("-"):
+
+        newMorphemeGloss = newMorphemeGloss[:-1]
+
+    #Replace the old gloss with the new gloss
+    glossList[glossList.index(m)] = newMorphemeGloss
+
+    #Return new forms
+    return ["-".join(phonList), "-".join(glossList)]
+
+#This function takes in a gloss string(e.g. "DEF-R0-R1-R2-INF")
+#and returns the number of morphemes that start with m. For example,
+#for m = "R", this function returns 2. It counts the number of
+#elements that are in the morpheme m in glossString
+def countElements(glossString, m):
+
+    glossList = glossString.split("-")
+    counter = 0
+
+    for g in glossList:
+
+        if g.startswith(m):
+
+            counter += 1
+
+    return counter
+
+#This function takes in a list of accents (e.g. ["A", "U", "A"])
+#and a corresponding list of glosses (e.g. ["DEF", "R0", "INF"]),
+#and applies Dybo's Rule to the form. It returns an integer: the
+#index of the element that Dybo's Rule predicts should carry
+#primary stress
+def applyDybo(accentList, glossList):
+
+    #If there is no accent, stress is root-final
+    if "A" not in accentList:
+
+        #Loop through the glossList backwards to quickly
+        #find the final element glossed as part of the root
+        for i in range(len(glossList) - 1, -1, -1):
+
+            #If this is part of the root
+            if glossList[i].startswith("R"):
+
+                #It's the final element of the root since we're
+                #looping backwards, so just return this index:
+                #stress is on the final element of the root
+                return i
+
+    #If there is at least one underlying accent, we apply Dybo's Rule
+    #proper, stressing the leftmost accent not immediately followed
+    #by an accent
+    else:
+
+        #Go through each accent from left to right
+        for i in range(len(accentList)):
+
+            #If this is the final accent, and we haven't
+            #assigned stress yet, this is the morpheme
+            #that should be stressed
+            if i == len(accentList) - 1:
+
+                return i
+
+            #For any non-final element
+            else:
+
+                #Assign stress here if it's an A followed by a U
+                if accentList[i] == "A" and accentList[i + 1] == "U":
+
+                    return i
+
+#The functions below take in the phonological shape of the element
+#that Dybo's Rule predicts is stressed, and return True if the
+#prediction matches the data, i.e. if that element is stressed.
+
+#Does the predicted element have a stressed vowel
+#(marked by a capital letter A, Y, V)?
+def stressedElement(phonElement):
+
+    return True in [bool(x in phonElement) for x in ["A", "Y", "V"]]
+
+#Does the predicted syllable have a stressed vowel?
+#We check for stressed A, but if the morpheme is vowelless then
+#we allow a final epenthetic schwa to count as a correct
+#prediction too.
+def stressedSyllable(phonElement):
+
+    return ("A" in phonElement or
+    ("a" not in phonElement.lower() and
+     phonElement[-1] == "Y"))
+
+#Dybo has the unaccented сас 'guest' surfacing with
+#final stress as сасЫ, so I'm going to allow the same thing
+#here, and say: morpheme-final stress results in absolute
+#final stress. He assumes that 'fixed' stress within these
+#paradigms is a secondary historical development, so he
+#shouldn't be able to analyze cases like акьАҿ кьАҿк.
+#I.e., what we want to check for is whether the morpheme
+#ends in a stressed vowel
+def stressedMorphemeFinal(phonElement):
+
+    return phonElement[-1] in ["A", "Y"]
+
+#If a root has no underlying syllables (no /a/),
+#we only allow the root to be unaccented. This function takes
+#a parsed nominal and returns True if its root has to be unaccented
+def unaccentedSyllables(n):
+
+    return "a" not in n[0][1:].lower()
+
+#Each segmentation scheme pairs a parse function with the
+#function checking whether the predicted unit is stressed,
+#and (optionally) a function telling us when the only root
+#accentuation we should try is the unaccented one
+schemes = {}
+schemes["elements"] = [parseElements, stressedElement, None]
+schemes["syllables"] = [parseSyllables, stressedSyllable, unaccentedSyllables]
+schemes["morphemes"] = [parseMorphemes, stressedMorphemeFinal, None]
+
+#This function takes in a parsed nominal (phonology, gloss), the index
+#of one of its forms (0 for the definite, 2 for the indefinite), a list
+#of accents for each element in the root, and a dictionary with the
+#accents of the functional morphemes (accentStatus by default), and
+#returns the index of the element Dybo's Rule predicts is stressed
+#in that form.
+def predictStress(n, i, rAccent, status = accentStatus):
+
+    #Extract gloss information
+    #We make a copy oldGlossList, since we'll
+    #modify glossList in the code below, but we
+    #still want access to the original (in particular,
+    #to know where the root is so we can assign root-
+    #final stress if needed)
+    glossList = n[i + 1].split("-")
+    oldGlossList = glossList[::]
+
+    #Replace the glosses with the accent of the relevant
+    #morpheme
+    for j in range(len(glossList)):
+
+        #If this element is part of the root
+        if glossList[j].startswith("R"):
+
+            #Replace with the relevant accent specification
+            #from the rAccent list
+            glossList[j] = rAccent[int(glossList[j][1:])]
+
+        #If this is a functional morpheme
+        else:
+
+            #Use the dictionary status to look up the
+            #accent status of this morpheme
+            glossList[j] = status[glossList[j]]
+
+    #Now we can pass the list of accents (e.g. [A, U, U, A]) to a
+    #function which will tell us which element Dybo's Rule
+    #predicts will be stressed
+
+    #Dybo's Rule (the baselines it is compared against, such as
+    #consistent initial or root-final stress, are in theories.py)
+    stressIndex = applyDybo(glossList, oldGlossList)
+
+    return stressIndex
+
+#This function evaluates Dybo's Rule against a nominal's 2 forms.
+#It takes in a nominal (phonology, gloss), a list of accents
+#for each element in the root, and the function used to check
+#whether the predicted element is stressed, and returns a list
+#of two 0s and 1s for which of the nominal's forms had their
+#stress correctly predicted. The accents of the functional
+#morphemes are looked up in status (accentStatus by default).
+def evaluateDybo(n, rAccent, isStressed, status = accentStatus):
+
+    evaluation = []
+
+    #Look at both nominal forms (indices 0 and 2 in n)
+    for i in [0, 2]:
+
+        phonList = n[i].split("-")
+        stressIndex = predictStress(n, i, rAccent, status)
+
+        #Now we have a prediction, and we want to check if it matches
+        #the data
+        if isStressed(phonList[stressIndex]):
+
+            #If yes, add 1 for a correct prediction
+            evaluation.append(1)
+
+        else:
+
+            #If no, add 0 for an incorrect prediction
+            evaluation.append(0)
+
+    return evaluation
+
+#This function loads a corpus file with one nominal per line
+#(definite orthography, definite phonology, indefinite orthography,
+#indefinite phonology), and returns a list of glossed nominals
+def loadNominals(fileName):
+
+    allNominals = []
+
+    with open(fileName, encoding = "utf-8") as f:
+
+        allNominals = f.read().split("\n")
+
+    return [glossNominal(nominal) for nominal in allNominals if nominal]
+
+#This function takes corpus records (defOrth, defPhon, indfOrth,
+#indfPhon), e.g. from a Corpus built in memory (see corpus.py in
+#Creating the corpus), and returns a list of glossed nominals, like
+#loadNominals does for a corpus file
+def nominalsFromRecords(records):
+
+    return [glossNominal(" ".join(record)) for record in records]
+
+#This function takes a corpus line and adds morpheme boundaries and
+#glosses. We add in a hyphen after the first segment of the definite
+#(the prefix), and before the last segment of the indefinite
+#(the suffix). The result is [phonology, gloss, phonology, gloss,
+#orthography, orthography], e.g.
+#[a-CCYC, DEF-R, CCYC-C, R-INDF, абӷьЫц, бҕьЫцк]
+def glossNominal(line):
+
+    tempNominal = line.split(" ")
+
+    return [f"{tempNominal[1][0]}-{tempNominal[1][1:]}", "DEF-R", f"{tempNominal[3][:-1]}-{tempNominal[3][-1:]}", "R-INDF", tempNominal[0], tempNominal[2]]
+
+#The key of a nominal's class: its definite and indefinite phonology
+#(e.g. ("a-CCYC", "CCYC-C")). Everything the evaluation looks at
+#follows from the key, so all nominals with the same key get the
+#same result.
+def nominalKey(n):
+
+    return (n[0], n[2])
+
+#This function takes a list of glossed nominals and groups them by
+#nominalKey. It returns a dictionary from each key to the list of
+#indices of the nominals in that class, in corpus order.
+def groupNominals(nominals):
+
+    classes = {}
+
+    for i in range(len(nominals)):
+
+        classes.setdefault(nominalKey(nominals[i]), []).append(i)
+
+    return classes
+
+#This function checks for root allomorphy. It returns True if the
+#root of the definite and the root of the indefinite differ (other
+#than in schwa), in which case we can't evaluate the nominal
+def hasRootAllomorphy(n):
+
+    rootURDef = n[0].split("-")[1].lower().replace("y", "")
+    rootURIndf = n[2].split("-")[0].lower().replace("y", "")
+
+    return len(set([rootURDef, rootURIndf])) > 1
+
+#This function breaks up the root of a glossed nominal into elements
+#under one of the schemes above. It returns a parsed copy of the
+#nominal and the number of root elements (in the definite), e.g.
+#[[a-C-CY-C, DEF-R0-R1-R2, C-CY-C-C, R0-R1-R2-INDF, ...], 3].
+def parseNominal(n, scheme):
+
+    parse = schemes[scheme][0]
+
+    nominal = n[::]
+    numRootElements = []
+
+    #This code breaks up the root into elements
+    for i in [0, 2]:
+
+        tempPhonString, tempGlossString = parse(nominal[i], nominal[i + 1], "R")
+        nominal[i] = tempPhonString
+        nominal[i + 1] = tempGlossString
+
+        numRootElements.append(countElements(tempGlossString, "R"))
+
+    return [nominal, numRootElements[0]]
+
+#This function searches through every possible accentuation of the
+#root of a glossed nominal under one of the schemes above, and returns
+#the best score and the accentuation that led to it, e.g.
+#[[1, 1], ("U", "A")]. It returns None if the nominal has root
+#allomorphy and can't be evaluated.
+def searchAccents(n, scheme):
+
+    isStressed, unaccentedOnly = schemes[scheme][1:]
+
+    if hasRootAllomorphy(n):
+
+        return None
+
+    nominal, numRootElements = parseNominal(n, scheme)
+
+    tempScore = []
+    tempHighscore = [0, 0]
+    tempHighAccents = tuple(["U"] * numRootElements)
+
+    #Go through every possibility for accents of the root
+    for rootAccent in product(["U", "A"], repeat = numRootElements):
+
+        if unaccentedOnly and unaccentedOnly(nominal) and "A" in rootAccent:
+
+            continue
+
+        #See how many forms this rootAccent accounts for
+        tempScore = evaluateDybo(nominal, rootAccent, isStressed)
+
+        #If we do better than our previous highscore
+        if tempScore.count(1) > tempHighscore.count(1):
+
+            #Update highscore to current score
+            #Store the rootAccent that led to this score
+            tempHighscore = tempScore
+            tempHighAccents = rootAccent
+
+        #We're never going to beat accounting for both forms
+        if tempHighscore.count(1) == 2:
+
+            break
+
+    return [tempHighscore, tempHighAccents]
+
+#This function returns the result of searchAccents for a glossed
+#nominal, except that with alignAllomorphs = True, nominals with root
+#allomorphy are evaluated with their roots aligned (see allomorphy.py)
+#instead of being left out
+def searchNominal(n, scheme, alignAllomorphs = False):
+
+    if alignAllomorphs and hasRootAllomorphy(n):
+
+        return allomorphy.searchAlignedAccents(n, scheme)
+
+    return searchAccents(n, scheme)
+
+#This function evaluates a list of glossed nominals under a scheme.
+#Nominals are grouped into classes, and searchAccents is only run
+#once per class. It returns a list with one result per nominal
+#(in the same order as nominals), and a dictionary from each class
+#key to its result and the number of nominals in the class.
+#The classes are evaluated in shards of shardSize classes. If a
+#checkpoint file is given, progress is saved to it at most every
+#checkpointInterval seconds, and at the end. With resume = True, the
+#shards finished in the checkpoint are skipped (see checkpoints.py).
+#With more than one worker, the shards are evaluated in parallel, with
+#the classes shared between the workers (see sharedCorpus.py). With
+#alignAllomorphs = True, nominals with root allomorphy are evaluated
+#too (see searchNominal). If a store file is given, the classes with a
+#result stored by an earlier run of the same version of the code are
+#not evaluated again, and the new results are added to the store,
+#which keeps at most storeSize results (see resultStore.py); shards
+#and checkpoints then only cover the classes not in the store.
+def evaluateNominals(nominals, scheme, checkpointFile = None, resume = False, shardSize = 256, checkpointInterval = 60, workers = 1, alignAllomorphs = False, storeFile = None, storeSize = 100000):
+
+    classes = groupNominals(nominals)
+    keys = list(classes)
+    classResults = {}
+    completedShards = set()
+    storedResults = {}
+
+    if storeFile:
+
+        store = resultStore.ResultStore(storeFile, storeSize)
+        moduleFiles = [__file__, allomorphy.__file__] if alignAllomorphs else [__file__]
+        version = resultStore.theoryVersion("Dybo's Rule", moduleFiles, {"accentStatus": accentStatus, "alignAllomorphs": alignAllomorphs})
+        storedResults = store.lookup(version, scheme, keys)
+
+    #The classes still to be evaluated
+    pending = [key for key in keys if key not in storedResults]
+
+    #Checkpoints with and without aligned allomorphs can't be mixed
+    checkpointScheme = f"{scheme}, aligned allomorphs" if alignAllomorphs else scheme
+
+    if checkpointFile:
+
+        fingerprint = checkpoints.corpusFingerprint({key: classes[key] for key in pending})
+
+    if checkpointFile and resume and os.path.exists(checkpointFile):
+
+        completedShards, classResults = checkpoints.loadCheckpoint(checkpointFile, checkpointScheme, fingerprint, accentStatus, shardSize)
+
+    lastCheckpoint = time.monotonic()
+
+    #One nominal from every class to evaluate, in the same order as
+    #pending
+    representatives = [nominals[classes[key][0]] for key in pending]
+    shards = [s for s in range((len(pending) + shardSize - 1) // shardSize) if s not in completedShards]
+
+    if workers > 1:
+
+        shardResults = sharedCorpus.evaluateShards(representatives, scheme, shards, shardSize, workers, alignAllomorphs)
+
+    else:
+
+        shardResults = ([s, [searchNominal(n, scheme, alignAllomorphs) for n in representatives[s * shardSize:(s + 1) * shardSize]]] for s in shards)
+
+    for shard, results in shardResults:
+
+        for key, result in zip(pending[shard * shardSize:(shard + 1) * shardSize], results):
+
+            classResults[key] = [result, len(classes[key])]
+
+        completedShards.add(shard)
+
+        if checkpointFile and time.monotonic() - lastCheckpoint >= checkpointInterval:
+
+            checkpoints.saveCheckpoint(checkpointFile, checkpointScheme, fingerprint, accentStatus, shardSize, completedShards, classResults)
+            lastCheckpoint = time.monotonic()
+
+    if checkpointFile:
+
+        checkpoints.saveCheckpoint(checkpointFile, checkpointScheme, fingerprint, accentStatus, shardSize, completedShards, classResults)
+
+    if storeFile:
+
+        store.update(version, scheme, {key: classResults[key][0] for key in pending})
+        store.save()
+
+    for key, result in storedResults.items():
+
+        classResults[key] = [result, len(classes[key])]
+
+    #Copy the result of each class back out to every nominal in it,
+    #and put the classes back in corpus order
+    results = [None] * len(nominals)
+
+    for key, members in classes.items():
+
+        for i in members:
+
+            results[i] = classResults[key][0]
+
+    return [results, {key: classResults[key] for key in keys}]
+
+#This function reads the command line arguments shared by the
+#Evaluating Dybo's Rule scripts: --checkpoint FILE saves progress to
+#FILE while evaluating, --resume continues from that checkpoint, and
+#--workers N evaluates in N processes. --approximate estimates the
+#totals from a stratified sample instead (see sampling.py), and
+#--align-allomorphs evaluates nominals with root allomorphy too.
+#--store FILE keeps the results of every run in FILE, and only
+#evaluates the classes it doesn't have a result for (see
+#resultStore.py).
+def parseArguments(description):
+
+    parser = argparse.ArgumentParser(description = description)
+    parser.add_argument("--workers", type = int, default = 1, help = "number of worker processes")
+    parser.add_argument("--approximate", action = "store_true", help = "estimate the totals from a stratified sample")
+    parser.add_argument("--sample-size", type = int, default = 100, help = "number of nominals to sample with --approximate")
+    parser.add_argument("--precision", type = float, help = "with --approximate, keep sampling until the confidence interval is at most this wide on either side")
+    parser.add_argument("--seed", type = int, help = "random seed for --approximate")
+    parser.add_argument("--align-allomorphs", action = "store_true", help = "evaluate nominals with root allomorphy under an alignment of their roots")
+    parser.add_argument("--checkpoint", help = "save progress to this checkpoint file")
+    parser.add_argument("--resume", action = "store_true", help = "skip work already saved in the checkpoint file")
+    parser.add_argument("--store", help = "reuse and save results in this result store file")
+    parser.add_argument("--store-size", type = int, default = 100000, help = "number of results kept in the result store")
+    args = parser.parse_args()
+
+    if args.resume and not args.checkpoint:
+
+        parser.error("--resume needs a --checkpoint file")
+
+    #The sample is evaluated in this process, without checkpoints or a
+    #result store
+    if args.approximate and (args.workers != 1 or args.checkpoint or args.store):
+
+        parser.error("--approximate can't be used with --workers, --checkpoint or --store")
+
+    return args
+
+#This function prints the results of evaluateNominals in the same
+#format for every script: nominals that aren't fully accounted for,
+#the totals, and the size and score of every class.
+def printReport(nominals, results, classResults):
+
+    nominalsCorrect = 0
+    nominalsTotal = 0
+    totalCorrect = 0
+    totalTotal = 0
+
+    for i in range(len(nominals)):
+
+        nominal = nominals[i]
+
+        if results[i] is None:
+
+            print(f"{nominal[-2]}, {nominal[-1]}: ROOT ALLOMORPHY. NOMINAL NOT EVALUATED.")
+
+            continue
+
+        tempHighscore, tempHighAccents = results[i]
+
+        totalCorrect += tempHighscore.count(1)
+        totalTotal += 2
+
+        if tempHighscore.count(1) == 2:
+
+            nominalsCorrect += 1
+
+        else:
+
+            print(f"{nominal[-2]}, {nominal[-1]}: {tempHighscore} with {str(tempHighAccents)}")
+
+        nominalsTotal += 1
+
+    print(f"Total correct predictions: {totalCorrect}")
+    print(f"Total forms predicted: {totalTotal}")
+    print(f"Nominals with 2/2 correct predictions: {nominalsCorrect}")
+    print(f"Nominals evaluated: {nominalsTotal}")
+    print(f"Phonological classes evaluated: {len(classResults)}")
+
+    #List the classes from largest to smallest
+    for key, [result, size] in sorted(classResults.items(), key = lambda c: -c[1][1]):
+
+        if result is None:
+
+            print(f"{key[0]} {key[1]}: {size} nominals, not evaluated")
+
+        else:
+
+            print(f"{key[0]} {key[1]}: {size} nominals, {result[0]} with {str(result[1])}")
+
+#The functions below learn the accents of the functional morphemes
+#instead of fixing them in accentStatus. Rather than re-running the
+#evaluation once per guess, we go through the corpus once, and for
+#each nominal record every affix accentuation under which some root
+#accentuation gets both forms right.
+
+#This function lists every way of assigning accents to the functional
+#morphemes in morphemes, e.g. for ["DEF", "INDF"]:
+#[{"DEF": "U", "INDF": "U"}, {"DEF": "A", "INDF": "U"}, ...]
+#Setting number s accents morpheme number i if bit i of s is 1, so
+#a set of settings fits in an integer with 2^len(morphemes) bits.
+def affixSettings(morphemes):
+
+    settings = []
+
+    for s in range(2 ** len(morphemes)):
+
+        setting = {}
+
+        for i in range(len(morphemes)):
+
+            setting[morphemes[i]] = "A" if (s >> i) & 1 else "U"
+
+        settings.append(setting)
+
+    return settings
+
+#This function takes a glossed nominal, a scheme, and a list of
+#settings from affixSettings, and returns a bitmask of the settings
+#under which some root accentuation predicts both forms correctly.
+#E.g. 0b0010 means only setting 1 (DEF = A, INDF = U) fits.
+#Functional morphemes not in the settings keep their accents from
+#accentStatus. It returns None if the nominal has root allomorphy.
+def fitMask(n, scheme, settings):
+
+    isStressed, unaccentedOnly = schemes[scheme][1:]
+
+    if hasRootAllomorphy(n):
+
+        return None
+
+    nominal, numRootElements = parseNominal(n, scheme)
+
+    #The accents of every functional morpheme under each setting
+    statuses = [{**accentStatus, **setting} for setting in settings]
+
+    mask = 0
+    allSettings = 2 ** len(settings) - 1
+
+    #Go through every possibility for accents of the root, trying
+    #every affix setting for each of them
+    for rootAccent in product(["U", "A"], repeat = numRootElements):
+
+        if unaccentedOnly and unaccentedOnly(nominal) and "A" in rootAccent:
+
+            continue
+
+        for s in range(len(settings)):
+
+            if not (mask >> s) & 1 and evaluateDybo(nominal, rootAccent, isStressed, statuses[s]) == [1, 1]:
+
+                mask |= 1 << s
+
+        #Every setting fits already
+        if mask == allSettings:
+
+            break
+
+    return mask
+
+#This function learns affix accents from a list of glossed nominals.
+#It computes fitMask once per phonological class, and returns the
+#masks for every nominal (None for root allomorphy), along with a
+#list with the number of nominals fitted by each setting.
+def learnAffixAccents(nominals, scheme, morphemes):
+
+    settings = affixSettings(morphemes)
+    masks = [None] * len(nominals)
+    counts = [0] * len(settings)
+
+    for key, members in groupNominals(nominals).items():
+
+        mask = fitMask(nominals[members[0]], scheme, settings)
+
+        for i in members:
+
+            masks[i] = mask
+
+        if mask is None:
+
+            continue
+
+        #Add the size of the class to every setting in the mask
+        for s in range(len(settings)):
+
+            if (mask >> s) & 1:
+
+                counts[s] += len(members)
+
+    return [masks, counts]
+
+#This function prints the affix settings ranked by how many nominals
+#they fit (i.e. get 2/2 correct predictions for)
+def printAffixRanking(morphemes, masks, counts):
+
+    settings = affixSettings(morphemes)
+    nominalsTotal = len([m for m in masks if m is not None])
+
+    print(f"Nominals evaluated: {nominalsTotal}")
+
+    for s in sorted(range(len(settings)), key = lambda s: -counts[s]):
+
+        setting = ", ".join([f"{m} = {settings[s][m]}" for m in morphemes])
+
+        print(f"{setting}: {counts[s]} nominals with 2/2 correct predictions")
@@ -0,0 +1,284 @@
+import json
+import sys
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import product
+from urllib.request import Request, urlopen
+
+import dybo
+
+#This module answers questions like "given this definite form, which
+#indefinite stress does each consistent accentuation predict?" for
+#other tools, without having to run a whole evaluation script. It is
+#used by Stress prediction server.py, which keeps it loaded and serves
+#predictions over HTTP on the local machine, or over stdin/stdout.
+#A request is a dictionary like
+#{"definite": "aCCYC", "indefinite": "CCyCC", "scheme": "elements"}
+#Forms are written with C, a, y, and A, Y for stressed vowels, and
+#requests that aren't are answered with an error. The indefinite is
+#optional (by default it is the definite root
+#followed by the suffix C), and so is the scheme (elements by default).
+#Requests are sent in batches (lists), and predictions are cached by
+#phonological form, so repeated forms are only computed once.
+
+#Number of distinct forms to keep in the cache
+cacheSize = 65536
+
+#This function removes stress from a phonological string
+def unstress(phonString):
+
+    return phonString.replace("A", "a").replace("Y", "y")
+
+#The segments phonological strings are made of
+vowels = ["a", "y", "A", "Y"]
+segments = vowels + ["C"]
+
+#These functions take in an unstressed element under a scheme, and
+#return the position of the vowel that is stressed when the element
+#is (None if it has no vowel), following the checks in dybo.schemes:
+#the first vowel of an element; the a of a syllable, or the final
+#(epenthetic) schwa of a syllable without one; the final vowel of a
+#morpheme, or its last vowel if it ends in a consonant.
+def elementVowel(element):
+
+    positions = [k for k in range(len(element)) if element[k] in vowels]
+
+    return positions[0] if positions else None
+
+def syllableVowel(element):
+
+    if "a" in element:
+
+        return element.index("a")
+
+    positions = [k for k in range(len(element)) if element[k] in vowels]
+
+    return positions[-1] if positions else None
+
+def morphemeVowel(element):
+
+    positions = [k for k in range(len(element)) if element[k] in vowels]
+
+    return positions[-1] if positions else None
+
+stressedVowels = {"elements": elementVowel, "syllables": syllableVowel, "morphemes": morphemeVowel}
+
+#This function takes in an unstressed phonological string (e.g. CCyC-C),
+#the same string as parsed by one of the schemes (e.g. C-Cv-C-C), an
+#element index and the scheme, and returns the unstressed string with
+#the vowel of that element stressed: C-CY-C-C, or None if the element
+#has no vowel to stress. The parse functions only add hyphens and change
+#vowel quality, so the elements line up with the original string
+#segment by segment.
+def stressElement(phonString, parsedString, i, scheme):
+
+    segments = phonString.replace("-", "")
+    phonList = []
+    start = 0
+
+    for element in parsedString.split("-"):
+
+        phonList.append(segments[start:start + len(element)])
+        start += len(element)
+
+    k = stressedVowels[scheme](phonList[i])
+
+    if k is None:
+
+        return None
+
+    phonList[i] = phonList[i][:k] + phonList[i][k].upper() + phonList[i][k + 1:]
+
+    return "-".join(phonList)
+
+#This function computes the predictions for one definite form (and
+#optionally its indefinite) under a scheme. It returns a dictionary
+#with every root accentuation which correctly predicts the stress of
+#the definite, and the indefinite stress that accentuation predicts
+#(with an error instead if it stresses an element without a vowel).
+#Forms whose roots can't be lined up element by element get an error.
+def computePrediction(scheme, definite, indefinite):
+
+    isStressed, unaccentedOnly = dybo.schemes[scheme][1:]
+
+    #By default the indefinite is the definite root plus the suffix
+    if not indefinite:
+
+        indefinite = definite[1:] + "C"
+
+    indefinite = unstress(indefinite)
+    n = dybo.glossNominal(f"- {definite} - {indefinite}")
+    prediction = {"scheme": scheme, "definite": definite, "indefinite": indefinite}
+
+    if dybo.hasRootAllomorphy(n):
+
+        prediction["error"] = "root allomorphy"
+
+        return prediction
+
+    nominal, numRootElements = dybo.parseNominal(n, scheme)
+    defPhonList = nominal[0].split("-")
+
+    #The roots can differ in schwa, and then be divided into different
+    #numbers of elements
+    if dybo.countElements(nominal[3], "R") != numRootElements:
+
+        prediction["error"] = "the roots of the definite and the indefinite have different numbers of elements"
+
+        return prediction
+    consistent = []
+
+    #Go through every possibility for accents of the root, keeping
+    #those which get the stress of the definite right
+    for rootAccent in product(["U", "A"], repeat = numRootElements):
+
+        if unaccentedOnly and unaccentedOnly(nominal) and "A" in rootAccent:
+
+            continue
+
+        if not isStressed(defPhonList[dybo.predictStress(nominal, 0, rootAccent)]):
+
+            continue
+
+        stressIndex = dybo.predictStress(nominal, 2, rootAccent)
+        predicted = {"accents": "".join(rootAccent), "stressIndex": stressIndex, "indefinite": stressElement(n[2], nominal[2], stressIndex, scheme)}
+
+        if predicted["indefinite"] is None:
+
+            predicted["error"] = "the predicted stress falls on an element without a vowel"
+
+        consistent.append(predicted)
+
+    prediction["predictions"] = consistent
+    prediction["indefinites"] = sorted(set([p["indefinite"] for p in consistent if p["indefinite"] is not None]))
+
+    return prediction
+
+predictForm = lru_cache(maxsize = cacheSize)(computePrediction)
+
+#This function changes the size of the prediction cache (emptying it)
+def setCacheSize(size):
+
+    global predictForm
+
+    predictForm = lru_cache(maxsize = size)(computePrediction)
+
+#This function checks that a form is a phonological string (e.g.
+#aCCYC) of at least two segments
+def isForm(form):
+
+    return isinstance(form, str) and len(form) >= 2 and all([s in segments for s in form])
+
+#This function takes in a single request dictionary and returns its
+#prediction, or a dictionary with an error message for bad requests
+def predictRequest(request):
+
+    if not isinstance(request, dict):
+
+        return {"error": "a request must be a dictionary"}
+
+    definite = request.get("definite")
+
+    if not isForm(definite) or definite[0] not in vowels or definite.count("A") + definite.count("Y") != 1:
+
+        return {"error": "a request needs a definite form of at least two segments (C, a, y, A, Y), starting with the prefix vowel, with one stressed vowel"}
+
+    indefinite = request.get("indefinite") or ""
+
+    if indefinite and (not isForm(indefinite) or indefinite[-1] != "C"):
+
+        return {"error": "the indefinite must be a form of at least two segments (C, a, y, A, Y), ending in the suffix C"}
+
+    scheme = request.get("scheme", "elements")
+
+    if not isinstance(scheme, str) or scheme not in dybo.schemes:
+
+        return {"error": f"unknown scheme {scheme}"}
+
+    return predictForm(scheme, definite, indefinite)
+
+#This function answers a batch (list) of requests, returning a list of
+#predictions in the same order. Forms that appear several times in the
+#batch, or that have been asked for before, come from the cache.
+def predictBatch(batch):
+
+    return [predictRequest(request) for request in batch]
+
+#This handler answers POST requests whose body is a JSON batch with a
+#JSON list of predictions
+class PredictionHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+
+        try:
+
+            batch = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+        except ValueError:
+
+            self.send_error(400, "request body is not JSON")
+
+            return
+
+        if not isinstance(batch, list):
+
+            self.send_error(400, "request body is not a list of requests")
+
+            return
+
+        body = json.dumps(predictBatch(batch), ensure_ascii = False).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    #Don't print a line for every request
+    def log_message(self, format, *args):
+
+        pass
+
+#This function creates a server for predictions on the local machine
+#only. Use port 0 to pick any free port (see server.server_address).
+def makeServer(port = 8642):
+
+    return ThreadingHTTPServer(("127.0.0.1", port), PredictionHandler)
+
+#This function answers batches read from stdin (one JSON list per
+#line) with batches on stdout (one JSON list per line)
+def serveStdio(inFile = sys.stdin, outFile = sys.stdout):
+
+    for line in inFile:
+
+        if not line.strip():
+
+            continue
+
+        try:
+
+            batch = json.loads(line)
+
+        except ValueError:
+
+            batch = None
+
+        if isinstance(batch, list):
+
+            outFile.write(json.dumps(predictBatch(batch), ensure_ascii = False) + "\n")
+
+        else:
+
+            outFile.write(json.dumps({"error": "each line must be a JSON list of requests"}) + "\n")
+
+        outFile.flush()
+
+#A local client: this function sends a batch of requests to a server
+#running on this machine and returns its list of predictions
+def queryServer(batch, port = 8642):
+
+    request = Request(f"http://127.0.0.1:{port}/", data = json.dumps(batch).encode("utf-8"), headers = {"Content-Type": "application/json"})
+
+    with urlopen(request) as response:
+
+        return json.loads(response.read().decode("utf-8"))
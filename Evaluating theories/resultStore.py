@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import time
+
+#This module keeps the results of evaluateNominals from one run to the
+#next, so a re-run only evaluates the phonological classes it hasn't
+#seen before (e.g. the few lines added to the corpus since the last
+#run). A result is stored under the version of the theory, the scheme,
+#and the class key (see dybo.nominalKey). The version is a hash of the
+#source code of the modules the result depends on and of the accents
+#of the functional morphemes, so editing the theory or its settings
+#starts from scratch, rather than reusing results it might no longer
+#give. Results of old versions are never looked up again; they are
+#dropped as the store fills up, least recently used first. The store
+#is a JSON file, saved atomically in the same way as checkpoints.
+
+#This function returns the version of a theory: a hash of its name,
+#the source files it depends on, and its settings (any value that can
+#be saved as JSON)
+def theoryVersion(name, moduleFiles, settings):
+
+    h = hashlib.sha256()
+    h.update(name.encode("utf-8"))
+
+    for fileName in moduleFiles:
+
+        with open(fileName, mode = "rb") as f:
+
+            h.update(hashlib.sha256(f.read()).digest())
+
+    h.update(json.dumps(settings, sort_keys = True).encode("utf-8"))
+
+    return h.hexdigest()
+
+class ResultStore:
+
+    #Loads the store saved in fileName, if there is one. maxEntries is
+    #the number of results kept when the store is saved.
+    def __init__(self, fileName, maxEntries = 100000):
+
+        self.fileName = fileName
+        self.maxEntries = maxEntries
+
+        #entries[entryKey]: [result, time last used]
+        self.entries = {}
+
+        if os.path.exists(fileName):
+
+            with open(fileName, encoding = "utf-8") as f:
+
+                self.entries = json.load(f)
+
+    #Class keys are pairs of strings, which JSON can't use as keys, so
+    #entries are stored under a single string
+    def entryKey(self, version, scheme, key):
+
+        return f"{version} {scheme} {key[0]} {key[1]}"
+
+    #This function returns a dictionary from every class key in keys
+    #with a stored result to that result
+    def lookup(self, version, scheme, keys):
+
+        found = {}
+        now = time.time()
+
+        for key in keys:
+
+            entry = self.entries.get(self.entryKey(version, scheme, key))
+
+            if entry is None:
+
+                continue
+
+            result = entry[0]
+
+            #Accents are stored as lists, but are tuples everywhere else
+            if result is not None:
+
+                result = [result[0], tuple(result[1])]
+
+            found[key] = result
+            entry[1] = now
+
+        return found
+
+    #This function stores the result of every class in results, a
+    #dictionary from class keys to results
+    def update(self, version, scheme, results):
+
+        now = time.time()
+
+        for key, result in results.items():
+
+            self.entries[self.entryKey(version, scheme, key)] = [result, now]
+
+    #This function drops the least recently used results over
+    #maxEntries, and atomically saves the store
+    def save(self):
+
+        if len(self.entries) > self.maxEntries:
+
+            kept = sorted(self.entries.items(), key = lambda e: -e[1][1])[:self.maxEntries]
+            self.entries = dict(kept)
+
+        tempFileName = self.fileName + ".tmp"
+
+        with open(tempFileName, mode = "w", encoding = "utf-8") as f:
+
+            json.dump(self.entries, f, ensure_ascii = False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tempFileName, self.fileName)
@@ -0,0 +1,235 @@
+import accentSets
+import dybo
+
+#Each nominal is evaluated on its own, so the same root appearing in
+#several entries of the corpus (e.g. a noun and a compound or derived
+#form starting with it, or the same word listed twice) can be given
+#contradictory accents without anyone noticing. This module finds the
+#nominals sharing a root and checks whether there is one accentuation
+#of the shared root that works for all of them.
+#
+#Roots are compared by their elements, spelled out in orthography
+#(e.g. бӷь-Ы-ц), so that two roots are only linked if they are the
+#same material divided up in the same way. Two nominals are linked if
+#their roots are the same, or if one root is made up of the first
+#elements of the other. Linked nominals are put into groups with
+#union-find, and each group is checked with the solution sets from
+#accentSets.py.
+
+#Letters which modify the preceding consonant (labialization and
+#palatalization) rather than being segments of their own
+modifiers = ["ә", "ь"]
+
+#This function takes the orthography of a root (e.g. бӷьЫц) and splits
+#it into segments corresponding to the segments of its phonological
+#transcription: [б, ӷь, ы, ц]
+def orthSegments(orth):
+
+    segments = []
+
+    for letter in orth.lower():
+
+        if letter in modifiers and segments:
+
+            segments[-1] += letter
+
+        else:
+
+            segments.append(letter)
+
+    return segments
+
+#This function takes a glossed nominal and a scheme, and returns its
+#root as a tuple of elements in orthography (e.g. ("б", "ӷьы", "ц")),
+#or None if the orthography doesn't line up with the phonology
+def rootElements(n, scheme):
+
+    nominal, numRootElements = dybo.parseNominal(n, scheme)
+    segments = orthSegments(n[4][1:])
+    phonElements = nominal[0].split("-")[1:]
+
+    if len(segments) != sum([len(e) for e in phonElements]):
+
+        return None
+
+    elements = []
+    start = 0
+
+    for e in phonElements:
+
+        elements.append("".join(segments[start:start + len(e)]))
+        start += len(e)
+
+    return tuple(elements)
+
+#Union-find: parents[i] is the parent of i, and the root of the tree
+#containing i is the representative of its group
+def find(parents, i):
+
+    root = i
+
+    while parents[root] != root:
+
+        root = parents[root]
+
+    #Path compression
+    while parents[i] != root:
+
+        parents[i], i = root, parents[i]
+
+    return root
+
+def union(parents, sizes, i, j):
+
+    i = find(parents, i)
+    j = find(parents, j)
+
+    if i == j:
+
+        return
+
+    #Union by size
+    if sizes[i] < sizes[j]:
+
+        i, j = j, i
+
+    parents[j] = i
+    sizes[i] += sizes[j]
+
+#This function takes a list of roots (tuples of elements, or None) and
+#returns the groups of indices of roots linked by being the same root,
+#or by one being a prefix of the other. Very short roots (a single CV
+#element, say) are the beginning of a great many unrelated roots, so
+#a root only counts as a prefix if it has at least minPrefixElements
+#elements. Roots are looked up in a dictionary, and each root only
+#looks up its own prefixes, so this takes time linear in the number of
+#roots (for roots of bounded length).
+def groupRoots(roots, minPrefixElements = 2):
+
+    parents = list(range(len(roots)))
+    sizes = [1] * len(roots)
+    index = {}
+
+    for i in range(len(roots)):
+
+        if roots[i] is not None:
+
+            index.setdefault(roots[i], []).append(i)
+
+    for i in range(len(roots)):
+
+        if roots[i] is None:
+
+            continue
+
+        #Same root (it's enough to link to the first with this root)
+        union(parents, sizes, i, index[roots[i]][0])
+
+        #A shorter root making up the beginning of this root
+        for p in range(minPrefixElements, len(roots[i])):
+
+            if roots[i][:p] in index:
+
+                union(parents, sizes, i, index[roots[i][:p]][0])
+
+    groups = {}
+
+    for i in range(len(roots)):
+
+        if roots[i] is not None:
+
+            groups.setdefault(find(parents, i), []).append(i)
+
+    return list(groups.values())
+
+#This function checks whether a group of roots can share accents.
+#roots[i] and sets[i] are the root elements and solution set of
+#member i. Members with the same first elements must have the same
+#accents on those elements. We go through the elements from left to
+#right like through a trie, keeping track of the state of every
+#member's solution set, and try both accents on each element. It
+#returns True if there is an accentuation that works for every member.
+def consistentGroup(roots, sets):
+
+    memo = {}
+
+    def consistent(depth, states):
+
+        key = (depth, frozenset(states.items()))
+
+        if key in memo:
+
+            return memo[key]
+
+        result = True
+        branches = {}
+
+        for i, state in states.items():
+
+            #Member i ends here, so its root has to be accepted
+            if len(roots[i]) == depth:
+
+                if state not in sets[i].accepting:
+
+                    result = False
+
+            else:
+
+                branches.setdefault(roots[i][depth], []).append(i)
+
+        #Every next element has to get an accent that works for all
+        #the members continuing with that element
+        for members in branches.values():
+
+            if not result:
+
+                break
+
+            result = False
+
+            for a in ["U", "A"]:
+
+                if all([a in sets[i].transitions[depth][states[i]] for i in members]):
+
+                    if consistent(depth + 1, {i: sets[i].transitions[depth][states[i]][a] for i in members}):
+
+                        result = True
+
+                        break
+
+        memo[key] = result
+
+        return result
+
+    if any([s.isEmpty() for s in sets]):
+
+        return False
+
+    return consistent(0, {i: sets[i].start for i in range(len(sets))})
+
+#This function checks every group of nominals sharing a root under a
+#scheme. It returns a list of groups, each a list of the indices of the
+#nominals in the group and whether the group has a consistent
+#accentuation. Groups with a single nominal are left out. Nominals with
+#root allomorphy, or with no consistent accentuation of their own, are
+#not grouped.
+def checkSharedRoots(nominals, scheme, minPrefixElements = 2):
+
+    sets = accentSets.solutionSets(nominals, scheme)
+    roots = [None] * len(nominals)
+
+    for i in range(len(nominals)):
+
+        if sets[i] is not None and not sets[i].isEmpty():
+
+            roots[i] = rootElements(nominals[i], scheme)
+
+    groups = []
+
+    for members in groupRoots(roots, minPrefixElements):
+
+        if len(members) > 1:
+
+            groups.append([members, consistentGroup([roots[i] for i in members], [sets[i] for i in members])])
+
+    return groups
@@ -0,0 +1,190 @@
+import math
+import random
+from statistics import NormalDist
+
+import dybo
+
+#This module estimates the totals of the Evaluating Dybo's Rule scripts
+#from a sample of the corpus, for quick checks while trying out changes
+#to a theory. The sample is stratified: nominals are divided into
+#strata by the length and CV template of their root, and every stratum
+#is sampled in proportion to its size, so that rare root shapes aren't
+#left out by chance. The estimate for the whole corpus is the average
+#of the stratum estimates weighted by stratum size, and its confidence
+#interval uses the usual variance of a stratified mean (with finite
+#population correction, since we sample without replacement).
+#Nominals with root allomorphy are left out of the strata, unless they
+#are evaluated with their roots aligned (see dybo.searchNominal).
+
+#Root templates shared by fewer nominals than this are put together
+#in one stratum per root length
+minStratumSize = 10
+
+#The two quantities we estimate, as a function of the number of forms
+#correctly predicted for a nominal (0, 1 or 2)
+measures = {}
+measures["nominals with 2/2 correct predictions"] = lambda correct: 1.0 if correct == 2 else 0.0
+measures["forms correctly predicted"] = lambda correct: correct / 2
+
+#This function returns the stratum of a glossed nominal: the length of
+#its root (in segments, in the definite) and its CV template, with
+#vowel quality and stress left out, e.g. (3, "CVC")
+def stratumKey(n):
+
+    root = n[0].split("-")[1]
+    template = "".join(["C" if s == "C" else "V" for s in root])
+
+    return (len(root), template)
+
+#This function divides the nominals without root allomorphy (or all
+#nominals, with alignAllomorphs = True) into strata. It returns a
+#dictionary from each stratum to the indices of its nominals. Templates
+#with fewer than minStratumSize nominals are merged into a stratum
+#(length, "*") for their root length.
+def stratify(nominals, alignAllomorphs = False):
+
+    strata = {}
+
+    for i in range(len(nominals)):
+
+        if alignAllomorphs or not dybo.hasRootAllomorphy(nominals[i]):
+
+            strata.setdefault(stratumKey(nominals[i]), []).append(i)
+
+    merged = {}
+
+    for (length, template), members in strata.items():
+
+        key = (length, template) if len(members) >= minStratumSize else (length, "*")
+        merged.setdefault(key, []).extend(members)
+
+    return merged
+
+#This function divides a sample size between the strata in proportion
+#to their sizes. Every stratum gets at least two nominals (or all of
+#them, if it has fewer), so its variance can be estimated.
+def allocate(strata, sampleSize):
+
+    population = sum([len(members) for members in strata.values()])
+
+    if population == 0:
+
+        raise ValueError("there are no nominals to sample from")
+
+    return {key: min(len(members), max(2, round(sampleSize * len(members) / population))) for key, members in strata.items()}
+
+#This function takes the strata, the number of nominals sampled from
+#each, and the values of the sampled nominals (in the order sampled),
+#and returns the stratified estimate of the mean with its confidence
+#interval: [mean, lower, upper]. A stratum with a single sampled
+#nominal gets the largest variance a value between 0 and 1 can have.
+def stratifiedEstimate(strata, values, confidence):
+
+    population = sum([len(members) for members in strata.values()])
+    mean = 0
+    variance = 0
+
+    for key, members in strata.items():
+
+        sample = values[key]
+        weight = len(members) / population
+        n = len(sample)
+        stratumMean = sum(sample) / n
+
+        if n > 1:
+
+            stratumVariance = sum([(v - stratumMean) ** 2 for v in sample]) / (n - 1)
+
+        else:
+
+            stratumVariance = 0.25
+
+        mean += weight * stratumMean
+        variance += weight ** 2 * (1 - n / len(members)) * stratumVariance / n
+
+    halfWidth = NormalDist().inv_cdf(1 - (1 - confidence) / 2) * math.sqrt(variance)
+
+    return [mean, max(0.0, mean - halfWidth), min(1.0, mean + halfWidth)]
+
+#This function estimates the proportion of nominals with 2/2 correct
+#predictions and of forms correctly predicted under a scheme from a
+#stratified sample of about sampleSize nominals. If precision is given,
+#the sample is doubled until the confidence interval for the nominals
+#with 2/2 correct predictions is at most precision wide on either side,
+#or the whole corpus has been evaluated. Each larger sample contains
+#the smaller ones, and every phonological class is only evaluated once.
+#It returns a dictionary with the number of nominals sampled, the
+#number that could have been sampled, and an estimate [mean, lower,
+#upper] for each of the measures above. It also counts the strata
+#where every sampled nominal got the same number of forms right (but
+#not every nominal was sampled): their variance is estimated as 0, so
+#if there are many, the interval is too narrow. alignAllomorphs is as
+#in dybo.evaluateNominals.
+def approximateEvaluation(nominals, scheme, sampleSize = 100, precision = None, confidence = 0.95, seed = None, alignAllomorphs = False):
+
+    rng = random.Random(seed)
+    strata = stratify(nominals, alignAllomorphs)
+    population = sum([len(members) for members in strata.values()])
+
+    #Shuffle every stratum once, so that a sample is the first few
+    #nominals of each stratum
+    order = {}
+
+    for key in sorted(strata):
+
+        order[key] = strata[key][::]
+        rng.shuffle(order[key])
+
+    classResults = {}
+
+    while True:
+
+        taken = allocate(strata, sampleSize)
+        correct = {}
+
+        for key in strata:
+
+            correct[key] = []
+
+            for i in order[key][:taken[key]]:
+
+                classKey = dybo.nominalKey(nominals[i])
+
+                if classKey not in classResults:
+
+                    classResults[classKey] = dybo.searchNominal(nominals[i], scheme, alignAllomorphs)
+
+                correct[key].append(classResults[classKey][0].count(1))
+
+        estimates = {}
+
+        for name, measure in measures.items():
+
+            values = {key: [measure(c) for c in correct[key]] for key in strata}
+            estimates[name] = stratifiedEstimate(strata, values, confidence)
+
+        sampled = sum(taken.values())
+        mean, lower, upper = estimates["nominals with 2/2 correct predictions"]
+
+        if precision is None or max(mean - lower, upper - mean) <= precision or sampled == population:
+
+            break
+
+        sampleSize = 2 * sampleSize
+
+    constantStrata = len([key for key in strata if len(set(correct[key])) == 1 and taken[key] < len(strata[key])])
+
+    return {"sampled": sampled, "population": population, "strata": len(strata), "constantStrata": constantStrata, "estimates": estimates}
+
+#This function prints the result of approximateEvaluation
+def printEstimate(evaluation, confidence = 0.95):
+
+    print(f"Nominals sampled: {evaluation['sampled']} of {evaluation['population']} in {evaluation['strata']} strata")
+
+    for name, [mean, lower, upper] in evaluation["estimates"].items():
+
+        print(f"Estimated {name}: {mean:.3f} [{lower:.3f}, {upper:.3f}] ({confidence:.0%} confidence)")
+
+    if evaluation["constantStrata"]:
+
+        print(f"Note: in {evaluation['constantStrata']} of {evaluation['strata']} strata every sampled nominal got the same number of forms right, so their variance is estimated as 0, and the intervals may be too narrow")
@@ -0,0 +1,126 @@
+import mmap
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import dybo
+
+#This module lets dybo.evaluateNominals spread its shards over several
+#worker processes without pickling the nominals for every task. The
+#glossed nominals are encoded once into a single file, and every worker
+#maps that file into memory read-only. The operating system keeps one
+#copy of the file in memory however many workers there are, so memory
+#use doesn't grow with the number of workers, and a task is just the
+#range of nominals to evaluate.
+#
+#The file consists of the number of nominals, the offsets of every
+#string (6 per nominal, see dybo.glossNominal) in the text, and the
+#text itself in UTF-8. All numbers are 8-byte integers.
+
+fieldsPerNominal = 6
+
+#This function encodes a list of glossed nominals and writes them to
+#fileName in the format described above
+def writeCorpus(nominals, fileName):
+
+    offsets = array("q", [0])
+    text = bytearray()
+
+    for n in nominals:
+
+        for field in n:
+
+            text += field.encode("utf-8")
+            offsets.append(len(text))
+
+    with open(fileName, mode = "wb") as f:
+
+        f.write(array("q", [len(nominals)]).tobytes())
+        f.write(offsets.tobytes())
+        f.write(text)
+
+class SharedCorpus:
+
+    #Maps a corpus file written by writeCorpus into memory read-only.
+    #Nothing is copied until a nominal is looked up.
+    def __init__(self, fileName):
+
+        with open(fileName, mode = "rb") as f:
+
+            self.map = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        self.view = memoryview(self.map)
+        self.size = self.view[:8].cast("q")[0]
+
+        #The offsets and the text are views into the mapped file
+        offsetsEnd = 8 * (self.size * fieldsPerNominal + 2)
+        self.offsets = self.view[8:offsetsEnd].cast("q")
+        self.text = self.view[offsetsEnd:]
+
+    def __len__(self):
+
+        return self.size
+
+    #The glossed nominal number i, decoded from the mapped file
+    def __getitem__(self, i):
+
+        if not 0 <= i < self.size:
+
+            raise IndexError("nominal index out of range")
+
+        first = i * fieldsPerNominal
+
+        return [str(self.text[self.offsets[j]:self.offsets[j + 1]], "utf-8") for j in range(first, first + fieldsPerNominal)]
+
+    def close(self):
+
+        self.offsets.release()
+        self.text.release()
+        self.view.release()
+        self.map.close()
+
+#The corpus mapped by each worker process
+workerCorpus = None
+
+#This function runs once in every worker process. It maps the corpus,
+#and copies the accents of the functional morphemes from the main
+#process (in place, since dybo's functions use accentStatus as a
+#default argument).
+def initWorker(fileName, status):
+
+    global workerCorpus
+
+    workerCorpus = SharedCorpus(fileName)
+    dybo.accentStatus.update(status)
+
+#This function evaluates the nominals from start up to stop in the
+#mapped corpus, and returns the shard number with their results
+def evaluateRange(scheme, shard, start, stop, alignAllomorphs = False):
+
+    return [shard, [dybo.searchNominal(workerCorpus[i], scheme, alignAllomorphs) for i in range(start, stop)]]
+
+#This function evaluates a list of glossed nominals shard by shard in
+#workers processes, where shard s is nominals[s * shardSize:(s + 1) *
+#shardSize]. It yields [shard, results] for every shard in shards, in
+#the order they finish (see dybo.searchNominal for alignAllomorphs).
+def evaluateShards(nominals, scheme, shards, shardSize, workers, alignAllomorphs = False):
+
+    handle, fileName = tempfile.mkstemp(suffix = ".corpus")
+    os.close(handle)
+
+    try:
+
+        writeCorpus(nominals, fileName)
+
+        with ProcessPoolExecutor(max_workers = workers, initializer = initWorker, initargs = (fileName, dict(dybo.accentStatus))) as executor:
+
+            futures = [executor.submit(evaluateRange, scheme, s, s * shardSize, min((s + 1) * shardSize, len(nominals)), alignAllomorphs) for s in shards]
+
+            for future in as_completed(futures):
+
+                yield future.result()
+
+    finally:
+
+        os.remove(fileName)
@@ -0,0 +1,197 @@
+from itertools import product
+
+import dybo
+
+#This module lets us evaluate several theories of stress side by side,
+#in one pass through the corpus. A theory is a function which takes a
+#list of accents and the corresponding list of glosses of a form (e.g.
+#["A", "U", "A"] and ["DEF", "R0", "INDF"]) and returns the index of
+#the element it predicts is stressed, like dybo.applyDybo. To add a
+#theory, write such a function and register it with registerTheory.
+#
+#A theory's prediction only depends on the pattern of accents and
+#glosses, and the corpus only has a small number of these. Before
+#evaluating, we therefore compile every theory into a table with its
+#prediction for every pattern seen in the corpus, so that checking a
+#form under a theory is a single dictionary lookup. Tables are kept
+#between evaluations, and only new patterns are added to them.
+
+theories = {}
+
+#Compiled prediction tables: for every theory, a dictionary from
+#(glosses, accents) to the index of the stressed element
+tables = {}
+
+#This function adds a theory under a name, replacing (and forgetting
+#the table of) any theory already registered under that name
+def registerTheory(name, predict):
+
+    theories[name] = predict
+    tables[name] = {}
+
+#The theories below are the baselines Dybo's Rule is compared against
+
+#Consistent initial stress
+def initialStress(accentList, glossList):
+
+    return 0
+
+#Consistent final stress
+def finalStress(accentList, glossList):
+
+    return len(glossList) - 1
+
+#Consistent root-initial stress
+def rootInitialStress(accentList, glossList):
+
+    return glossList.index("R0")
+
+#Consistent root-final stress
+def rootFinalStress(accentList, glossList):
+
+    for i in range(len(glossList) - 1, -1, -1):
+
+        if glossList[i].startswith("R"):
+
+            return i
+
+registerTheory("Dybo's Rule", dybo.applyDybo)
+registerTheory("initial stress", initialStress)
+registerTheory("final stress", finalStress)
+registerTheory("root-initial stress", rootInitialStress)
+registerTheory("root-final stress", rootFinalStress)
+
+#This function takes a tuple of glosses, the accents of the root and
+#a dictionary with the accents of the functional morphemes, and
+#returns the tuple of accents of the form
+def accentPattern(glosses, rootAccent, status):
+
+    return tuple([rootAccent[int(g[1:])] if g.startswith("R") else status[g] for g in glosses])
+
+#This function takes a glossed nominal and a scheme, and returns
+#[nominal, numRootElements, forms], where nominal is parsed under the
+#scheme (see dybo.parseNominal), and forms has one entry per form:
+#the tuple of its glosses, and a list saying which of its elements are
+#stressed in the data (1 or 0)
+def parseForms(n, scheme):
+
+    isStressed = dybo.schemes[scheme][1]
+    nominal, numRootElements = dybo.parseNominal(n, scheme)
+    forms = []
+
+    for i in [0, 2]:
+
+        forms.append([tuple(nominal[i + 1].split("-")), [1 if isStressed(p) else 0 for p in nominal[i].split("-")]])
+
+    return [nominal, numRootElements, forms]
+
+#This function returns the root accentuations tried for a parsed
+#nominal, in the same order as dybo.searchAccents
+def rootAccents(nominal, numRootElements, scheme):
+
+    unaccentedOnly = dybo.schemes[scheme][2]
+
+    for rootAccent in product(["U", "A"], repeat = numRootElements):
+
+        if unaccentedOnly and unaccentedOnly(nominal) and "A" in rootAccent:
+
+            continue
+
+        yield rootAccent
+
+#This function fills in the tables of the named theories with every
+#pattern of glosses and accents that can come up when evaluating the
+#nominals under a scheme
+def compileTables(nominals, scheme, names, status = dybo.accentStatus):
+
+    patterns = set()
+
+    for members in dybo.groupNominals(nominals).values():
+
+        n = nominals[members[0]]
+
+        if dybo.hasRootAllomorphy(n):
+
+            continue
+
+        nominal, numRootElements, forms = parseForms(n, scheme)
+
+        for rootAccent in rootAccents(nominal, numRootElements, scheme):
+
+            for glosses, correct in forms:
+
+                patterns.add((glosses, accentPattern(glosses, rootAccent, status)))
+
+    for name in names:
+
+        table = tables[name]
+
+        for glosses, accents in patterns:
+
+            if (glosses, accents) not in table:
+
+                table[(glosses, accents)] = theories[name](list(accents), list(glosses))
+
+#This function does the same as dybo.searchAccents, but for several
+#theories at once, looking their predictions up in the compiled
+#tables. It returns a dictionary from each theory to its result
+#(the best score and the root accentuation that led to it, or None
+#if the nominal has root allomorphy).
+def searchTheories(n, scheme, names, status = dybo.accentStatus):
+
+    if dybo.hasRootAllomorphy(n):
+
+        return {name: None for name in names}
+
+    nominal, numRootElements, forms = parseForms(n, scheme)
+    best = {name: [[0, 0], tuple(["U"] * numRootElements)] for name in names}
+    searching = list(names)
+
+    for rootAccent in rootAccents(nominal, numRootElements, scheme):
+
+        patterns = [(glosses, accentPattern(glosses, rootAccent, status)) for glosses, correct in forms]
+
+        for name in searching:
+
+            score = [forms[k][1][tables[name][patterns[k]]] for k in range(len(forms))]
+
+            if score.count(1) > best[name][0].count(1):
+
+                best[name] = [score, rootAccent]
+
+        #A theory that accounts for both forms is done
+        searching = [name for name in searching if best[name][0].count(1) < 2]
+
+        if not searching:
+
+            break
+
+    return best
+
+#This function evaluates a list of glossed nominals under a scheme with
+#every named theory (all registered theories by default), searching
+#once per phonological class. It returns a dictionary from each theory
+#to [results, classResults], in the same format as
+#dybo.evaluateNominals, so that dybo.printReport can be used on them.
+def evaluateTheories(nominals, scheme, names = None, status = dybo.accentStatus):
+
+    names = list(theories) if names is None else names
+    compileTables(nominals, scheme, names, status)
+
+    classes = dybo.groupNominals(nominals)
+    evaluations = {name: [[None] * len(nominals), {}] for name in names}
+
+    for key, members in classes.items():
+
+        best = searchTheories(nominals[members[0]], scheme, names, status)
+
+        for name in names:
+
+            results, classResults = evaluations[name]
+            classResults[key] = [best[name], len(members)]
+
+            for i in members:
+
+                results[i] = best[name]
+
+    return evaluations